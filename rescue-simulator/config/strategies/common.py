@@ -0,0 +1,98 @@
+"""
+Utilidades compartidas por las estrategias de ambos equipos
+"""
+import itertools
+from typing import List, Tuple, Optional, Dict
+
+# Las 24 permutaciones posibles de las 4 direcciones: una sola tirada elige un orden aleatorio
+DIR_PERMS = tuple(itertools.permutations(((1, 0), (-1, 0), (0, 1), (0, -1))))
+
+
+class ResourceIndex:
+    """
+    Índice de los recursos del tick actual en columnas paralelas (posición, valor, tipo, objeto).
+    Se construye una vez por update() y lo comparten todos los vehículos, evitando
+    repetir la introspección (hasattr/isinstance/get_node) de cada recurso por vehículo.
+    """
+    __slots__ = ("positions", "values", "types", "resources", "_pick_masks", "_can_pick_cache")
+    
+    def __init__(self, resources: List, graph, can_pick_cache: Optional[Dict[Tuple[Optional[str], str], bool]] = None):
+        self.positions: List[Tuple[int, int]] = []
+        self.values: List[int] = []
+        self.types: List[Optional[str]] = []
+        self.resources: List = []
+        self._pick_masks: Dict[Optional[str], List[bool]] = {}
+        # Caché (tipo de vehículo, tipo de recurso) -> puede recoger; compartida entre ticks
+        self._can_pick_cache = can_pick_cache if can_pick_cache is not None else {}
+        
+        for resource in resources:
+            # Obtener posición del recurso
+            res_pos = None
+            if hasattr(resource, "position"):
+                res_pos = resource.position
+            elif isinstance(resource, dict):
+                res_pos = resource.get("position")
+            
+            if not res_pos or len(res_pos) != 2:
+                continue
+            
+            # Convertir de (x, y) a (row, col)
+            res_row, res_col = res_pos[1], res_pos[0]
+            
+            # Verificar que el nodo existe y tiene un recurso
+            node = graph.get_node(res_row, res_col)
+            if not node or node.state != "resource":
+                continue
+            
+            # Obtener valor del recurso
+            if hasattr(resource, "puntos"):
+                value = resource.puntos
+            elif isinstance(resource, dict):
+                value = resource.get("puntos", resource.get("value", 1))
+            else:
+                value = 1
+            
+            # Obtener tipo del recurso
+            if hasattr(resource, "tipo"):
+                res_type = resource.tipo
+            elif isinstance(resource, dict):
+                res_type = resource.get("tipo", resource.get("subtype"))
+            else:
+                res_type = None
+            
+            self.positions.append((res_row, res_col))
+            self.values.append(value)
+            self.types.append(res_type)
+            self.resources.append(resource)
+    
+    def __len__(self) -> int:
+        return len(self.resources)
+    
+    def pick_mask(self, vehicle) -> List[bool]:
+        """
+        Máscara de recursos que el vehículo puede considerar (los de tipo desconocido se permiten).
+        Se memoiza por tipo de vehículo: todos los vehículos del mismo tipo comparten capacidades.
+        """
+        vehicle_type = getattr(vehicle, "type", None)
+        mask = self._pick_masks.get(vehicle_type)
+        if mask is None:
+            can_pick = getattr(vehicle, "can_pick", None)
+            cache = self._can_pick_cache
+            mask = []
+            for res_type in self.types:
+                if can_pick is None or not res_type:
+                    mask.append(True)
+                    continue
+                key = (vehicle_type, res_type)
+                ok = cache.get(key)
+                if ok is None:
+                    ok = cache[key] = bool(can_pick(res_type))
+                mask.append(ok)
+            self._pick_masks[vehicle_type] = mask
+        return mask
+    
+    def can_pick_any(self, vehicle) -> bool:
+        """Indica si queda algún recurso de tipo conocido que el vehículo pueda recoger"""
+        if not hasattr(vehicle, "can_pick"):
+            return False
+        return any(ok and res_type for ok, res_type in zip(self.pick_mask(vehicle), self.types))
@@ -3,9 +3,15 @@ Estrategia del Equipo 1: BFS (Breadth-First Search)
 - Recolectores: BFS hacia recursos de mayor valor (priorizar mayor valor, en empate el más cercano según BFS)
 - Motos: Atacar camiones enemigos con BFS, si no hay camiones, recoger recursos con BFS
 """
+import heapq
+import random
+from array import array
 from collections import deque
 from typing import List, Tuple, Optional, Set, Dict
 
+from config.strategies.common import DIR_PERMS, ResourceIndex
+
+
 class Strategy1:
     
     def __init__(self, map_width, map_height, map, enemy_player=None):
@@ -16,6 +22,11 @@ class Strategy1:
         self.vehicle_targets: Dict[str, Tuple[int, int]] = {}
         self._mine_cache: Dict[Tuple[int, int, int], bool] = {}  # (row, col, tick) -> is_safe
         self._last_cache_tick: int = -1
+        self._safe_mask: bytearray = bytearray()
+        self._safe_mask_tick: int = -1
+        self._can_pick_cache: Dict[Tuple[Optional[str], str], bool] = {}  # (tipo vehículo, tipo recurso) -> puede recoger
+        self._place_graph = None
+        self._place_fn = None
     
     def get_current_tick(self) -> int:
         """Obtiene el tick actual del mapa"""
@@ -65,75 +76,185 @@ class Strategy1:
         
         return False
     
-    def bfs_path(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000) -> Optional[List[Tuple[int, int]]]:
+    def _get_place_fn(self):
         """
-        BFS para encontrar el camino más corto.
-        Trata minas como bloqueadas y evita posiciones ocupadas por compañeros de equipo.
+        Devuelve graph.place_vehicle (o None si el grafo no lo soporta).
+        Se resuelve una sola vez por grafo; clear_map() crea un grafo nuevo y fuerza re-resolverlo.
         """
-        if start == target:
-            return [start]
+        graph = getattr(self.map, "graph", None)
+        if graph is not self._place_graph:
+            self._place_graph = graph
+            place_fn = getattr(graph, "place_vehicle", None)
+            self._place_fn = place_fn if callable(place_fn) else None
+        return self._place_fn
+    
+    def _get_safe_mask(self) -> bytearray:
+        """
+        Devuelve la máscara plana de seguridad del tick actual, indexada por row * cols + col.
+        Valores: 0 = sin calcular, 1 = segura, 2 = minada. Se reinicia cuando cambia el tick.
+        """
+        tick = self.get_current_tick()
+        size = self.map.rows * self.map.cols
+        if tick != self._safe_mask_tick or len(self._safe_mask) != size:
+            self._safe_mask = bytearray(size)
+            self._safe_mask_tick = tick
+        return self._safe_mask
+    
+    def _bfs_search(self, start_idx: int, target_idx: int, player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000, max_depth: Optional[int] = None) -> Optional[array]:
+        """
+        Núcleo del BFS sobre índices planos (row * cols + col).
+        Retorna el arreglo de padres si alcanza el objetivo, None si no hay camino
+        o si el objetivo está a más de max_depth pasos.
+        """
+        rows, cols = self.map.rows, self.map.cols
+        grid = self.map.graph.grid
+        
+        visited = bytearray(rows * cols)
+        visited[start_idx] = 1
+        parent = array('i', [-1]) * (rows * cols)
+        safe_mask = self._get_safe_mask()
         
-        queue = deque([(start, [start])])
-        visited = {start}
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        # Solo evitar compañeros si es un movimiento planificado (no bloquear BFS por vehículos en el mapa)
+        # Esto permite que BFS encuentre rutas que requieren que otros vehículos se muevan
+        blocked = set()
+        if planned_moves:
+            for other_id, (other_row, other_col) in planned_moves.items():
+                if other_id != vehicle_id:
+                    blocked.add(other_row * cols + other_col)
+            blocked.discard(target_idx)
+        
+        # Determinar la base enemiga (no se permite entrar salvo que sea el objetivo)
+        enemy_base = None
+        if hasattr(player, "name"):
+            enemy_base = "base_p2" if "1" in player.name else "base_p1"
+        
+        queue = deque([start_idx])
+        directions = ((-1, 0), (1, 0), (0, -1), (0, 1))
         iterations = 0
         
+        # Control de profundidad por capas: al agotar una capa se incrementa la profundidad
+        depth = 0
+        layer_remaining = 1
+        next_layer = 0
+        
         while queue and iterations < max_iterations:
             iterations += 1
-            current_pos, path = queue.popleft()
+            current = queue.popleft()
             
-            if current_pos == target:
-                return path
+            if current == target_idx:
+                return parent
             
-            row, col = current_pos
+            row, col = divmod(current, cols)
             
             for dr, dc in directions:
                 new_row, new_col = row + dr, col + dc
                 
-                if not (0 <= new_row < self.map.rows and 0 <= new_col < self.map.cols):
+                if not (0 <= new_row < rows and 0 <= new_col < cols):
                     continue
                 
-                neighbor = (new_row, new_col)
+                neighbor = new_row * cols + new_col
                 
-                if neighbor in visited:
+                if visited[neighbor] or neighbor in blocked:
                     continue
                 
-                # Verificar si la posición es segura (no minada)
-                if not self.is_position_safe(new_row, new_col):
+                # Verificar si la posición es segura (no minada), calculando una sola vez por tick
+                safe = safe_mask[neighbor]
+                if safe == 0:
+                    safe = 1 if self.is_position_safe(new_row, new_col) else 2
+                    safe_mask[neighbor] = safe
+                if safe == 2:
                     continue
                 
-                # Solo evitar compañeros si es un movimiento planificado (no bloquear BFS por vehículos en el mapa)
-                # Esto permite que BFS encuentre rutas que requieren que otros vehículos se muevan
-                if planned_moves and neighbor != target:
-                    if self.is_occupied_by_teammate(new_row, new_col, player, vehicle_id, planned_moves):
-                        continue
-                
-                # No permitir entrar en la base enemiga
-                node = self.map.graph.get_node(new_row, new_col)
-                if node:
-                    # Determinar qué base es del jugador actual
-                    if hasattr(player, "name"):
-                        player_base = "base_p1" if "1" in player.name else "base_p2"
-                        enemy_base = "base_p2" if player_base == "base_p1" else "base_p1"
-                        # No permitir entrar en base enemiga (excepto si es el objetivo)
-                        if node.state == enemy_base and neighbor != target:
-                            continue
+                # No permitir entrar en la base enemiga (excepto si es el objetivo)
+                if enemy_base and neighbor != target_idx and grid[new_row][new_col].state == enemy_base:
+                    continue
                 
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                queue.append(neighbor)
+                next_layer += 1
+            
+            layer_remaining -= 1
+            if layer_remaining == 0:
+                depth += 1
+                layer_remaining = next_layer
+                next_layer = 0
+                # La siguiente capa ya supera el límite: el objetivo no está a max_depth pasos
+                if max_depth is not None and depth > max_depth:
+                    return None
         
         return None
     
-    def bfs_distance(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None) -> int:
+    def bfs_path(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000, max_depth: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
+        """
+        BFS para encontrar el camino más corto.
+        Trata minas como bloqueadas y evita posiciones ocupadas por compañeros de equipo.
+        OPTIMIZADO: usa índices planos (row * cols + col) con bytearray/array en lugar de tuplas, sets y dicts
+        """
+        if start == target:
+            return [start]
+        
+        cols = self.map.cols
+        target_idx = target[0] * cols + target[1]
+        parent = self._bfs_search(start[0] * cols + start[1], target_idx, player, vehicle_id, planned_moves, max_iterations, max_depth)
+        if parent is None:
+            return None
+        
+        path = []
+        current = target_idx
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = parent[current]
+        path.reverse()
+        return path
+    
+    def bfs_first_step(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_depth: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Obtiene solo el primer paso del camino más corto hacia el objetivo.
+        No reconstruye el camino completo; la profundidad solo se limita si se pasa max_depth.
+        Retorna None si no hay camino (o si supera max_depth pasos).
+        """
+        if start == target:
+            return None
+        
+        cols = self.map.cols
+        start_idx = start[0] * cols + start[1]
+        current = target[0] * cols + target[1]
+        parent = self._bfs_search(start_idx, current, player, vehicle_id, planned_moves, max_depth=max_depth)
+        if parent is None:
+            return None
+        
+        # Retroceder por la cadena de padres hasta el nodo que sigue al inicio
+        while parent[current] != start_idx:
+            current = parent[current]
+        return divmod(current, cols)
+    
+    def bfs_distance(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_depth: Optional[int] = None) -> int:
         """
         Calcula la distancia en pasos usando BFS entre dos posiciones.
-        Retorna -1 si no hay camino.
+        Retorna -1 si no hay camino (o si supera max_depth pasos).
         """
-        path = self.bfs_path(start, target, player, vehicle_id, planned_moves)
+        path = self.bfs_path(start, target, player, vehicle_id, planned_moves, max_depth=max_depth)
         if path:
             return len(path) - 1
         return -1
     
+    @staticmethod
+    def _extract_vehicle(content) -> Tuple[Optional[str], object, Optional[str], Optional[str]]:
+        """
+        Normaliza el contenido de un nodo con vehículo a (id, objeto, tipo, estado).
+        El grafo puede guardar el vehículo directamente o como dict {"id", "object", ...};
+        si el dict no trae "object", el tipo y estado se leen del propio dict.
+        """
+        if content is None:
+            return None, None, None, None
+        if type(content) is dict:
+            obj = content.get("object")
+            if obj:
+                return content.get("id"), obj, getattr(obj, "type", None), getattr(obj, "status", None)
+            return content.get("id"), None, content.get("type"), content.get("status")
+        return getattr(content, "id", None), content, getattr(content, "type", None), getattr(content, "status", None)
+    
     def find_enemy_trucks(self, player) -> List[Tuple[int, int]]:
         """
         Encuentra todos los camiones enemigos en el mapa que no estén destruidos
@@ -149,31 +270,14 @@ class Strategy1:
             for col in range(self.map.cols):
                 node = self.map.graph.get_node(row, col)
                 if node and (node.state == "vehicle" or node.state in ("base_p1", "base_p2")) and node.content:
-                    vehicle_content = node.content
-                    vehicle_id = None
-                    vehicle_obj = None
-                    
-                    if isinstance(vehicle_content, dict):
-                        vehicle_id = vehicle_content.get("id")
-                        vehicle_obj = vehicle_content.get("object")
-                    else:
-                        vehicle_id = getattr(vehicle_content, "id", None)
-                        vehicle_obj = vehicle_content
-                    
+                    vehicle_id, _, vehicle_type, status = self._extract_vehicle(node.content)
                     if vehicle_id and vehicle_id not in current_player_ids:
-                        if vehicle_obj:
-                            vehicle_type = getattr(vehicle_obj, "type", None)
-                            status = getattr(vehicle_obj, "status", None)
-                        else:
-                            vehicle_type = vehicle_content.get("type") if isinstance(vehicle_content, dict) else None
-                            status = vehicle_content.get("status") if isinstance(vehicle_content, dict) else None
-                        
                         if vehicle_type == "camion" and status != "destroyed":
                             enemy_trucks.append((row, col))
         
         return enemy_trucks
     
-    def find_best_resource(self, vehicle, resources: List, player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, assigned_targets: Set[Tuple[int, int]] = None) -> Optional[Tuple[object, Tuple[int, int]]]:
+    def find_best_resource(self, vehicle, resources: "List | ResourceIndex", player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, assigned_targets: Set[Tuple[int, int]] = None) -> Optional[Tuple[object, Tuple[int, int]]]:
         """
         Encuentra el mejor recurso: mayor valor, en empate el más cercano según BFS.
         Solo considera recursos que el vehículo puede recoger.
@@ -181,6 +285,9 @@ class Strategy1:
         Busca en TODO el mapa sin restricciones de distancia.
         OPTIMIZADO: usa heurística Manhattan para priorizar recursos y reducir BFS innecesarios
         """
+        if not isinstance(resources, ResourceIndex):
+            resources = ResourceIndex(resources, self.map.graph, self._can_pick_cache)
+        
         if not resources:
             return None
         
@@ -196,59 +303,32 @@ class Strategy1:
         # Lista de candidatos por valor
         candidates_by_value: Dict[int, List] = {}
         
-        for resource in resources:
-            # Obtener posición del recurso
-            res_pos = None
-            if hasattr(resource, "position"):
-                res_pos = resource.position
-            elif isinstance(resource, dict):
-                res_pos = resource.get("position")
-            
-            if not res_pos or len(res_pos) != 2:
+        # Solo recursos que el vehículo puede recoger (máscara precalculada por tipo de vehículo)
+        pick_mask = resources.pick_mask(vehicle)
+        positions = resources.positions
+        values = resources.values
+        
+        for i in range(len(resources)):
+            if not pick_mask[i]:
                 continue
             
-            # Convertir de (x, y) a (row, col)
-            res_x, res_y = res_pos[0], res_pos[1]
-            res_row, res_col = res_y, res_x
-            
-            # Verificar que el nodo existe y tiene un recurso
-            node = self.map.graph.get_node(res_row, res_col)
-            if not node or node.state != "resource":
-                continue
+            res_pos = positions[i]
             
             # Evitar recursos ya asignados a otros vehículos
-            if (res_row, res_col) in assigned_targets:
+            if res_pos in assigned_targets:
                 continue
             
-            # Obtener valor del recurso
-            if hasattr(resource, "puntos"):
-                value = resource.puntos
-            elif isinstance(resource, dict):
-                value = resource.get("puntos", resource.get("value", 1))
-            else:
-                value = 1
-            
-            # Obtener tipo del recurso
-            if hasattr(resource, "tipo"):
-                res_type = resource.tipo
-            elif isinstance(resource, dict):
-                res_type = resource.get("tipo", resource.get("subtype"))
-            else:
-                res_type = None
-            
-            # Verificar si el vehículo puede recoger este tipo de recurso
-            if res_type and hasattr(vehicle, "can_pick") and not vehicle.can_pick(res_type):
-                continue
+            value = values[i]
             
             # Agrupar por valor para optimización
             if value not in candidates_by_value:
                 candidates_by_value[value] = []
             
             # Calcular distancia Manhattan como heurística rápida
-            manhattan_dist = abs(vehicle_pos[0] - res_row) + abs(vehicle_pos[1] - res_col)
+            manhattan_dist = abs(vehicle_pos[0] - res_pos[0]) + abs(vehicle_pos[1] - res_pos[1])
             candidates_by_value[value].append({
-                'resource': resource,
-                'pos': (res_row, res_col),
+                'resource': resources.resources[i],
+                'pos': res_pos,
                 'manhattan': manhattan_dist
             })
         
@@ -286,7 +366,8 @@ class Strategy1:
         """
         Encuentra el camión enemigo más cercano usando BFS.
         Evita camiones ya asignados a otros vehículos.
-        OPTIMIZADO: usa Manhattan para priorizar y reduce BFS
+        OPTIMIZADO: usa Manhattan para priorizar y reduce BFS; los BFS siguientes al primero
+        se limitan a la mejor distancia encontrada
         """
         if not enemy_trucks:
             return None
@@ -296,25 +377,23 @@ class Strategy1:
         
         vehicle_pos = vehicle.position
         
-        available_trucks = []
-        for truck_pos in enemy_trucks:
-            if truck_pos not in assigned_targets:
-                manhattan = abs(vehicle_pos[0] - truck_pos[0]) + abs(vehicle_pos[1] - truck_pos[1])
-                available_trucks.append({'pos': truck_pos, 'manhattan': manhattan})
+        v_row, v_col = vehicle_pos
+        available_trucks = [(abs(v_row - t_row) + abs(v_col - t_col), (t_row, t_col))
+                            for t_row, t_col in enemy_trucks if (t_row, t_col) not in assigned_targets]
         
         if not available_trucks:
             return None
         
-        available_trucks.sort(key=lambda x: x['manhattan'])
-        
-        max_checks = min(2, len(available_trucks))
+        # Los 2 más cercanos por Manhattan en una sola pasada (estable, igual que ordenar y cortar)
+        candidates = heapq.nsmallest(2, available_trucks, key=lambda t: t[0])
         
         closest_truck = None
         min_distance = float('inf')
         
-        for truck_info in available_trucks[:max_checks]:
-            truck_pos = truck_info['pos']
-            distance = self.bfs_distance(vehicle_pos, truck_pos, player, vehicle_id, planned_moves)
+        for _, truck_pos in candidates:
+            # Solo sirve un camino estrictamente más corto que el mejor ya encontrado: acotar el BFS
+            bound = None if closest_truck is None else min_distance - 1
+            distance = self.bfs_distance(vehicle_pos, truck_pos, player, vehicle_id, planned_moves, max_depth=bound)
             if distance >= 0 and distance < min_distance:
                 min_distance = distance
                 closest_truck = truck_pos
@@ -332,10 +411,9 @@ class Strategy1:
         if vehicle_pos == target_pos:
             return vehicle_pos
         
-        path = self.bfs_path(vehicle_pos, target_pos, player, vehicle_id, planned_moves)
+        next_pos = self.bfs_first_step(vehicle_pos, target_pos, player, vehicle_id, planned_moves)
         
-        if path and len(path) > 1:
-            next_pos = path[1]
+        if next_pos is not None:
             # Verificar una vez más que el siguiente movimiento es válido
             if not self.is_occupied_by_teammate(next_pos[0], next_pos[1], player, vehicle_id, planned_moves):
                 return next_pos
@@ -355,8 +433,12 @@ class Strategy1:
             not self.is_occupied_by_teammate(new_row, new_col, player, vehicle_id, planned_moves)):
             return (new_row, new_col)
         
-        # Intentar alternativas en orden de preferencia
-        for alt_dr, alt_dc in [(dr, 0), (0, dc), (1, 0), (-1, 0), (0, 1), (0, -1)]:
+        # Intentar alternativas en orden de preferencia, sin repetir direcciones ya probadas
+        tried = {(dr, dc)}
+        for alt_dr, alt_dc in ((dr, 0), (0, dc), (1, 0), (-1, 0), (0, 1), (0, -1)):
+            if (alt_dr, alt_dc) in tried:
+                continue
+            tried.add((alt_dr, alt_dc))
             alt_row = row + alt_dr
             alt_col = col + alt_dc
             if (self.is_position_safe(alt_row, alt_col) and 
@@ -372,7 +454,6 @@ class Strategy1:
         Intenta moverse hacia el centro del mapa o explorar áreas no visitadas.
         """
         row, col = vehicle.position
-        import random
         
         # Calcular dirección hacia el centro del mapa
         center_row = self.map.rows // 2
@@ -390,9 +471,8 @@ class Strategy1:
         elif col > center_col:
             preferred_directions.append((0, -1))  
         
-        all_directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        
-        random.shuffle(preferred_directions)
+        if len(preferred_directions) == 2 and random.randrange(2):
+            preferred_directions.reverse()
         for dr, dc in preferred_directions:
             new_row = row + dr
             new_col = col + dc
@@ -401,8 +481,7 @@ class Strategy1:
                 not self.is_occupied_by_teammate(new_row, new_col, player, vehicle_id, planned_moves)):
                 return (new_row, new_col)
         
-        random.shuffle(all_directions)
-        for dr, dc in all_directions:
+        for dr, dc in DIR_PERMS[random.randrange(24)]:
             new_row = row + dr
             new_col = col + dc
             
@@ -459,21 +538,6 @@ class Strategy1:
         resources = []
         if hasattr(self.map, 'all_resources') and callable(self.map.all_resources):
             resources = self.map.all_resources()
-            valid_resources = []
-            for res in resources:
-                if hasattr(res, "position"):
-                    res_pos = res.position
-                elif isinstance(res, dict):
-                    res_pos = res.get("position")
-                else:
-                    continue
-                if res_pos and len(res_pos) == 2:
-                    res_x, res_y = res_pos[0], res_pos[1]
-                    res_row, res_col = res_y, res_x
-                    node = self.map.graph.get_node(res_row, res_col)
-                    if node and node.state == "resource":
-                        valid_resources.append(res)
-            resources = valid_resources
         else:
             for row in range(self.map.rows):
                 for col in range(self.map.cols):
@@ -487,7 +551,13 @@ class Strategy1:
                                 content['position'] = (col, row)
                             resources.append(content)
         
-        enemy_trucks = self.find_enemy_trucks(player)
+        # Normalizar los recursos una sola vez por tick (valida que sigan en el mapa)
+        resources = ResourceIndex(resources, self.map.graph, self._can_pick_cache)
+        
+        # Solo las motos persiguen camiones: sin motos activas no hace falta escanear el mapa
+        has_moto = any(getattr(v, "type", None) == "moto" and getattr(v, "status", None) != "destroyed"
+                       for v in vehicles.values())
+        enemy_trucks = self.find_enemy_trucks(player) if has_moto else []
         
         # Planificar movimientos de todos los vehículos primero para evitar colisiones
         planned_moves: Dict[str, Tuple[int, int]] = {}
@@ -570,19 +640,7 @@ class Strategy1:
             
             # Si el vehículo está en la base SIN objetivo, verificar si es porque no hay recursos
             if vehicle_status == "in_base" and target_pos is None:
-                can_pick_any = False
-                if hasattr(vehicle, "can_pick"):
-                    for res in resources:
-                        if hasattr(res, "tipo"):
-                            res_type = res.tipo
-                        elif isinstance(res, dict):
-                            res_type = res.get("tipo", res.get("subtype"))
-                        else:
-                            continue
-                        
-                        if res_type and vehicle.can_pick(res_type):
-                            can_pick_any = True
-                            break
+                can_pick_any = resources.can_pick_any(vehicle)
                 
                 # Si no hay recursos que pueda recoger, cambiar estado a "job_done"
                 if not can_pick_any:
@@ -623,19 +681,7 @@ class Strategy1:
                         vehicle.arrive_base()
                         
                         # Verificar si hay recursos que ESTE vehículo pueda recoger
-                        can_pick_any = False
-                        if hasattr(vehicle, "can_pick"):
-                            for res in resources:
-                                if hasattr(res, "tipo"):
-                                    res_type = res.tipo
-                                elif isinstance(res, dict):
-                                    res_type = res.get("tipo", res.get("subtype"))
-                                else:
-                                    continue
-                                
-                                if res_type and vehicle.can_pick(res_type):
-                                    can_pick_any = True
-                                    break
+                        can_pick_any = resources.can_pick_any(vehicle)
                         
                         if can_pick_any and len(assigned_targets) < len(resources):
                             vehicle.status = "in_base"
@@ -658,17 +704,15 @@ class Strategy1:
             # Solo mover si el vehículo no está destruido, la posición cambió y no está en estados terminales
             if (vehicle_status not in ("destroyed", "job_done") and 
                 (new_row, new_col) != current_pos):
-                try:
-                    tick = self.get_current_tick()
-                    mine_manager = self.get_mine_manager()
-                    
-                    if hasattr(self.map, "graph") and callable(getattr(self.map.graph, "place_vehicle", None)):
-                        self.map.graph.place_vehicle(
+                place_fn = self._get_place_fn()
+                if place_fn is not None:
+                    try:
+                        place_fn(
                             vehicle, new_row, new_col, 
-                            tick=tick, 
-                            mine_manager=mine_manager, 
+                            tick=self.get_current_tick(), 
+                            mine_manager=self.get_mine_manager(), 
                             player1=player, 
                             player2=self.enemy_player
                         )
-                except Exception as e:
-                    pass
+                    except Exception:
+                        pass
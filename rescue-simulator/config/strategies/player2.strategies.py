@@ -4,10 +4,25 @@ Estrategia del Equipo 2: Dijkstra
 - Motos: Atacar camiones enemigos con Dijkstra, si no hay camiones, recoger recursos con Dijkstra
 """
 import heapq
+import random
+from array import array
 from typing import List, Tuple, Optional, Set, Dict
 
+from config.strategies.common import DIR_PERMS, ResourceIndex
+
+
 class Strategy2:
     
+    # Atributos fijos: acceso más rápido que por __dict__ en los bucles de búsqueda
+    __slots__ = (
+        "map_width", "map_height", "map", "enemy_player", "vehicle_targets",
+        "_mine_cache", "_last_cache_tick", "_search_cache", "_path_cache", "_path_cache_tick",
+        "_weight_grid", "_weight_grid_tick", "_uniform_weight", "_cell_mask", "_cell_mask_key",
+        "_neighbor_table", "_neighbor_table_size", "_can_pick_cache",
+    )
+    
+    PATH_CACHE_MAX = 512  # Máximo de caminos memorizados por tick
+    
     def __init__(self, map_width, map_height, map, enemy_player=None):
         self.map_width = map_width
         self.map_height = map_height
@@ -16,6 +31,19 @@ class Strategy2:
         self.vehicle_targets: Dict[str, Tuple[int, int]] = {}
         self._mine_cache: Dict[Tuple[int, int, int], bool] = {}  # (row, col, tick) -> is_safe
         self._last_cache_tick: int = -1
+        # (origen, bloqueos) -> (distancias, predecesores) de las búsquedas del update() en curso
+        self._search_cache: Dict[Tuple[Tuple[int, int], frozenset], Tuple[Dict, array]] = {}
+        # (origen, destino, bloqueos, max_iterations) -> camino (o None si no hay) del tick actual
+        self._path_cache: Dict[Tuple[Tuple[int, int], Tuple[int, int], frozenset, int], Optional[List[Tuple[int, int]]]] = {}
+        self._path_cache_tick: int = -1
+        self._weight_grid: List[float] = []
+        self._weight_grid_tick: int = -1
+        self._uniform_weight: Optional[float] = None  # Peso común de todas las celdas, None si varían
+        self._cell_mask: bytearray = bytearray()
+        self._cell_mask_key: Tuple[int, Optional[str]] = (-1, None)
+        self._neighbor_table: List[Tuple[int, ...]] = []
+        self._neighbor_table_size: Tuple[int, int] = (0, 0)
+        self._can_pick_cache: Dict[Tuple[Optional[str], str], bool] = {}  # (tipo vehículo, tipo recurso) -> puede recoger
     
     def get_current_tick(self) -> int:
         """Obtiene el tick actual del mapa"""
@@ -82,77 +110,391 @@ class Strategy2:
         
         return 1.0
     
-    def dijkstra_path(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000) -> Optional[List[Tuple[int, int]]]:
+    def _get_weight_grid(self) -> List[float]:
         """
-        Dijkstra para encontrar el camino de menor costo.
-        Trata minas como bloqueadas y evita posiciones ocupadas por compañeros de equipo.
+        Costo de entrar a cada celda, en una lista plana indexada por row * cols + col.
+        Se arma una vez por tick para no consultar get_node/hasattr en cada relajación.
         """
-        if start == target:
-            return [start]
-        
-        pq = [(0.0, start)]
-        costs = {start: 0.0}
-        predecessors = {start: None}
-        
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        tick = self.get_current_tick()
+        size = self.map.rows * self.map.cols
+        if tick != self._weight_grid_tick or len(self._weight_grid) != size:
+            get_node = self.map.graph.get_node
+            grid = []
+            for row in range(self.map.rows):
+                for col in range(self.map.cols):
+                    node = get_node(row, col)
+                    grid.append(float(node.weight) if node and hasattr(node, 'weight') else 1.0)
+            self._weight_grid = grid
+            self._weight_grid_tick = tick
+            self._uniform_weight = grid[0] if grid and min(grid) == max(grid) else None
+        return self._weight_grid
+    
+    # Clasificación de celdas en _cell_mask (0 = sin calcular)
+    _CELL_OPEN = 1
+    _CELL_MINED = 2
+    _CELL_ENEMY_BASE = 3
+    # Estados de nodo que pueden alojar un vehículo (escaneo de respaldo de find_enemy_trucks)
+    _VEHICLE_STATES = frozenset(("vehicle", "base_p1", "base_p2"))
+    
+    def _get_cell_mask(self, enemy_base: Optional[str]) -> bytearray:
+        """
+        Máscara plana (row * cols + col) con la clasificación de cada celda para las búsquedas:
+        libre, minada o base enemiga. Se llena a demanda y se reinicia con cada tick.
+        """
+        key = (self.get_current_tick(), enemy_base)
+        size = self.map.rows * self.map.cols
+        if key != self._cell_mask_key or len(self._cell_mask) != size:
+            self._cell_mask = bytearray(size)
+            self._cell_mask_key = key
+        return self._cell_mask
+    
+    def _get_neighbor_table(self) -> List[Tuple[int, ...]]:
+        """
+        Vecinos válidos (arriba, abajo, izquierda, derecha) de cada celda como índices planos.
+        Depende solo del tamaño del mapa: se calcula una vez y evita divmod y chequeos de
+        límites dentro de los bucles de búsqueda.
+        """
+        rows, cols = self.map.rows, self.map.cols
+        if self._neighbor_table_size != (rows, cols):
+            table = []
+            for row in range(rows):
+                for col in range(cols):
+                    table.append(tuple(
+                        (row + dr) * cols + (col + dc)
+                        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                        if 0 <= row + dr < rows and 0 <= col + dc < cols
+                    ))
+            self._neighbor_table = table
+            self._neighbor_table_size = (rows, cols)
+        return self._neighbor_table
+    
+    def _classify_cell(self, row: int, col: int, enemy_base: Optional[str]) -> int:
+        """Calcula la clasificación de una celda para _cell_mask"""
+        if not self.is_position_safe(row, col):
+            return self._CELL_MINED
+        if enemy_base:
+            node = self.map.graph.get_node(row, col)
+            if node and node.state == enemy_base:
+                return self._CELL_ENEMY_BASE
+        return self._CELL_OPEN
+    
+    def _is_enclosed(self, target_idx: int, start_idx: int, blocked: Set[int], cell_mask: bytearray, enemy_base: Optional[str], neighbor_table) -> bool:
+        """
+        Indica si a un objetivo no se puede llegar en ningún caso: está minado o ninguno de sus
+        vecinos se expande en la búsqueda (todos minados, bloqueados o en la base enemiga).
+        Permite descartarlo antes de buscar en lugar de agotar la región alcanzable.
+        """
+        cols = self.map.cols
+        if cell_mask[target_idx] == 0:
+            cell_mask[target_idx] = self._classify_cell(*divmod(target_idx, cols), enemy_base)
+        if cell_mask[target_idx] == self._CELL_MINED:
+            return True
+        for neighbor in neighbor_table[target_idx]:
+            if neighbor == start_idx:
+                return False
+            cell = cell_mask[neighbor]
+            if cell == 0:
+                cell = cell_mask[neighbor] = self._classify_cell(*divmod(neighbor, cols), enemy_base)
+            if cell == self._CELL_OPEN and neighbor not in blocked:
+                return False
+        return True
+    
+    def dijkstra_multi_target(self, start: Tuple[int, int], targets: Set[Tuple[int, int]], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000) -> Tuple[Dict[Tuple[int, int], float], array]:
+        """
+        Dijkstra desde un origen hacia varios objetivos a la vez.
+        Se detiene cuando todos los objetivos quedan asentados (o se agota la búsqueda).
+        Retorna (distancias, predecesores): distancias solo contiene los objetivos alcanzados y
+        predecesores es un arreglo plano de índices (row * cols + col, -1 = sin predecesor).
+        Cada objetivo puede ocupar una celda bloqueada (compañero planificado o base enemiga):
+        se entra en él pero no se expande, igual que al buscarlo por separado.
+        OPTIMIZADO: una sola búsqueda reemplaza un Dijkstra completo por cada candidato;
+        trabaja con índices planos y arreglos en lugar de tuplas y dicts; los objetivos
+        encerrados se descartan antes de buscar
+        """
+        rows, cols = self.map.rows, self.map.cols
+        start_idx = start[0] * cols + start[1]
+        target_idxs = {r * cols + c for r, c in targets}
+        
+        distances: Dict[Tuple[int, int], float] = {}
+        predecessors = array('i', [-1]) * (rows * cols)
+        if start_idx in target_idxs:
+            distances[start] = 0.0
+            if len(distances) == len(target_idxs):
+                return distances, predecessors
+        
+        # Determinar la base enemiga (no se permite entrar salvo que sea un objetivo)
+        enemy_base = None
+        if hasattr(player, "name"):
+            player_base = "base_p1" if "1" in player.name else "base_p2"
+            enemy_base = "base_p2" if player_base == "base_p1" else "base_p1"
+        
+        # Celdas de los movimientos planificados por los otros vehículos (se calcula una vez por búsqueda)
+        blocked = {r * cols + c for r, c in self._blocked_key(vehicle_id, planned_moves)}
+        cell_mask = self._get_cell_mask(enemy_base)
+        neighbor_table = self._get_neighbor_table()
+        
+        # Un objetivo encerrado nunca se asienta: sin descartarlo la búsqueda recorre todo lo alcanzable
+        target_idxs = {t for t in target_idxs
+                       if t == start_idx or not self._is_enclosed(t, start_idx, blocked, cell_mask, enemy_base, neighbor_table)}
+        if len(distances) == len(target_idxs):
+            return distances, predecessors
+        
+        weight_grid = self._get_weight_grid()
+        if self._uniform_weight is not None:
+            self._uniform_multi_target(start_idx, target_idxs, blocked, max_iterations, enemy_base,
+                                       cell_mask, distances, predecessors)
+            return distances, predecessors
+        
+        # Referencias locales para el bucle interno
+        heappush, heappop = heapq.heappush, heapq.heappop
+        classify = self._classify_cell
+        MINED, ENEMY_BASE = self._CELL_MINED, self._CELL_ENEMY_BASE
+        
+        # El heap guarda (costo, índice): desempata igual que (costo, (row, col))
+        pq = [(0.0, start_idx)]
+        costs = array('d', [float('inf')]) * (rows * cols)
+        costs[start_idx] = 0.0
         iterations = 0
         
         while pq and iterations < max_iterations:
             iterations += 1
-            current_cost, current_pos = heapq.heappop(pq)
+            current_cost, current = heappop(pq)
             
-            if current_pos == target:
-                path = []
-                pos = target
-                while pos is not None:
-                    path.append(pos)
-                    pos = predecessors[pos]
-                return list(reversed(path))
-            
-            if current_cost > costs.get(current_pos, float('inf')):
+            if current_cost > costs[current]:
                 continue
             
-            row, col = current_pos
+            if current in target_idxs and current != start_idx:
+                distances[divmod(current, cols)] = current_cost
+                if len(distances) == len(target_idxs):
+                    break
+                # Un objetivo bloqueado solo es alcanzable como destino, no como paso intermedio
+                if current in blocked or cell_mask[current] == ENEMY_BASE:
+                    continue
             
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
+            for neighbor in neighbor_table[current]:
+                # Clasificar la celda una sola vez por tick (minada / base enemiga / libre)
+                cell = cell_mask[neighbor]
+                if cell == 0:
+                    cell = cell_mask[neighbor] = classify(*divmod(neighbor, cols), enemy_base)
+                if cell == MINED:
+                    continue
                 
-                if not (0 <= new_row < self.map.rows and 0 <= new_col < self.map.cols):
+                # Solo evitar compañeros si es un movimiento planificado (no bloquear Dijkstra por vehículos en el mapa)
+                # y no entrar en la base enemiga, salvo que la celda sea un objetivo
+                if (cell == ENEMY_BASE or neighbor in blocked) and neighbor not in target_idxs:
                     continue
                 
-                neighbor = (new_row, new_col)
+                # Calcular el costo de moverse a este vecino (mismo valor que get_edge_weight)
+                new_cost = current_cost + weight_grid[neighbor]
                 
-                # Verificar si la posición es segura (no minada)
-                if not self.is_position_safe(new_row, new_col):
-                    continue
+                # Si encontramos un camino más barato, actualizar
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    predecessors[neighbor] = current
+                    heappush(pq, (new_cost, neighbor))
+        
+        return distances, predecessors
+    
+    def _uniform_multi_target(self, start_idx: int, target_idxs: Set[int], blocked: Set[int], max_iterations: int, enemy_base: Optional[str], cell_mask: bytearray, distances: Dict[Tuple[int, int], float], predecessors: array) -> None:
+        """
+        Variante de dijkstra_multi_target para cuando todas las celdas cuestan lo mismo:
+        Dijkstra se reduce a un BFS por capas, sin heap. Cada capa se recorre ordenada por
+        índice plano, que es el mismo orden en que heapq desempata (costo, posición), así que
+        los caminos y desempates son idénticos a los de la versión con heap.
+        Completa distances y predecessors en el lugar.
+        """
+        weight = self._uniform_weight
+        rows, cols = self.map.rows, self.map.cols
+        
+        neighbor_table = self._get_neighbor_table()
+        classify = self._classify_cell
+        MINED, ENEMY_BASE = self._CELL_MINED, self._CELL_ENEMY_BASE
+        visited = bytearray(rows * cols)
+        visited[start_idx] = 1
+        iterations = 0
+        layer = [start_idx]
+        layer_cost = 0.0
+        
+        while layer:
+            next_layer = []
+            next_cost = layer_cost + weight
+            
+            for current in layer:
+                if iterations >= max_iterations:
+                    return
+                iterations += 1
                 
-                # Solo evitar compañeros si es un movimiento planificado (no bloquear Dijkstra por vehículos en el mapa)
-                # Esto permite que Dijkstra encuentre rutas que requieren que otros vehículos se muevan
-                if planned_moves and neighbor != target:
-                    if self.is_occupied_by_teammate(new_row, new_col, player, vehicle_id, planned_moves):
+                if current in target_idxs and current != start_idx:
+                    distances[divmod(current, cols)] = layer_cost
+                    if len(distances) == len(target_idxs):
+                        return
+                    # Un objetivo bloqueado solo es alcanzable como destino, no como paso intermedio
+                    if current in blocked or cell_mask[current] == ENEMY_BASE:
                         continue
                 
-                # No permitir entrar en la base enemiga
-                node = self.map.graph.get_node(new_row, new_col)
-                if node:
-                    if hasattr(player, "name"):
-                        player_base = "base_p1" if "1" in player.name else "base_p2"
-                        enemy_base = "base_p2" if player_base == "base_p1" else "base_p1"
-                        if node.state == enemy_base and neighbor != target:
-                            continue
-                
-                # Calcular el costo de moverse a este vecino
-                edge_weight = self.get_edge_weight(current_pos, neighbor)
-                new_cost = current_cost + edge_weight
+                for neighbor in neighbor_table[current]:
+                    # Con costo uniforme, la primera vez que se alcanza una celda es la más barata
+                    if visited[neighbor]:
+                        continue
+                    
+                    cell = cell_mask[neighbor]
+                    if cell == 0:
+                        cell = cell_mask[neighbor] = classify(*divmod(neighbor, cols), enemy_base)
+                    if cell == MINED:
+                        continue
+                    if (cell == ENEMY_BASE or neighbor in blocked) and neighbor not in target_idxs:
+                        continue
+                    
+                    visited[neighbor] = 1
+                    predecessors[neighbor] = current
+                    next_layer.append(neighbor)
+            
+            next_layer.sort()
+            layer = next_layer
+            layer_cost = next_cost
+    
+    def astar_path(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000) -> Optional[List[Tuple[int, int]]]:
+        """
+        A* hacia un único objetivo con heurística Manhattan.
+        La heurística se escala por el menor peso de celda, así nunca sobreestima y el camino
+        sigue siendo de costo mínimo (mismas reglas de paso que dijkstra_multi_target).
+        """
+        if start == target:
+            return [start]
+        if not self.is_position_safe(target[0], target[1]):
+            return None
+        
+        rows, cols = self.map.rows, self.map.cols
+        start_idx = start[0] * cols + start[1]
+        target_idx = target[0] * cols + target[1]
+        target_row, target_col = target
+        
+        enemy_base = None
+        if hasattr(player, "name"):
+            player_base = "base_p1" if "1" in player.name else "base_p2"
+            enemy_base = "base_p2" if player_base == "base_p1" else "base_p1"
+        
+        cell_mask = self._get_cell_mask(enemy_base)
+        blocked = {r * cols + c for r, c in self._blocked_key(vehicle_id, planned_moves)}
+        weight_grid = self._get_weight_grid()
+        neighbor_table = self._get_neighbor_table()
+        if self._is_enclosed(target_idx, start_idx, blocked, cell_mask, enemy_base, neighbor_table):
+            return None
+        h_scale = min(weight_grid) if weight_grid else 1.0
+        heappush, heappop = heapq.heappush, heapq.heappop
+        classify = self._classify_cell
+        OPEN = self._CELL_OPEN
+        
+        costs = array('d', [float('inf')]) * (rows * cols)
+        predecessors = array('i', [-1]) * (rows * cols)
+        costs[start_idx] = 0.0
+        # (f, h, g, índice): en empate de f se prefiere el nodo más cercano al objetivo.
+        # g se guarda tal cual: recuperarlo como f - h no es exacto con pesos fraccionarios
+        h0 = (abs(start[0] - target_row) + abs(start[1] - target_col)) * h_scale
+        pq = [(h0, h0, 0.0, start_idx)]
+        iterations = 0
+        
+        while pq and iterations < max_iterations:
+            iterations += 1
+            _, _, current_cost, current = heappop(pq)
+            
+            if current == target_idx:
+                return self._reconstruct_path(predecessors, target)
+            
+            if current_cost > costs[current]:
+                continue
+            
+            for neighbor in neighbor_table[current]:
+                if neighbor != target_idx:
+                    cell = cell_mask[neighbor]
+                    if cell == 0:
+                        cell = cell_mask[neighbor] = classify(*divmod(neighbor, cols), enemy_base)
+                    if cell != OPEN or neighbor in blocked:
+                        continue
                 
-                # Si encontramos un camino más barato, actualizar
-                if new_cost < costs.get(neighbor, float('inf')):
+                new_cost = costs[current] + weight_grid[neighbor]
+                if new_cost < costs[neighbor]:
                     costs[neighbor] = new_cost
-                    predecessors[neighbor] = current_pos
-                    heapq.heappush(pq, (new_cost, neighbor))
-                
+                    predecessors[neighbor] = current
+                    new_row, new_col = divmod(neighbor, cols)
+                    h = (abs(new_row - target_row) + abs(new_col - target_col)) * h_scale
+                    heappush(pq, (new_cost + h, h, new_cost, neighbor))
+        
         return None
     
+    def _reconstruct_path(self, predecessors: array, target: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Reconstruye el camino desde el origen hasta target siguiendo el arreglo de predecesores"""
+        cols = self.map.cols
+        path = []
+        pos = target[0] * cols + target[1]
+        while pos != -1:
+            path.append(divmod(pos, cols))
+            pos = predecessors[pos]
+        path.reverse()
+        return path
+    
+    @staticmethod
+    def _blocked_key(vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None) -> frozenset:
+        """Posiciones planificadas por los otros vehículos: determinan qué celdas bloquea Dijkstra"""
+        if not planned_moves:
+            return frozenset()
+        return frozenset(pos for other_id, pos in planned_moves.items() if other_id != vehicle_id)
+    
+    def _search_from(self, start: Tuple[int, int], targets: Set[Tuple[int, int]], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None) -> Tuple[Dict[Tuple[int, int], float], array]:
+        """
+        Ejecuta dijkstra_multi_target y guarda el resultado para este update(), indexado por
+        (origen, posiciones bloqueadas por compañeros). get_next_move lo reutiliza si su
+        objetivo ya fue asentado con los mismos bloqueos, en vez de repetir Dijkstra.
+        """
+        blocked = self._blocked_key(vehicle_id, planned_moves)
+        distances, predecessors = self.dijkstra_multi_target(start, targets, player, vehicle_id, planned_moves)
+        self._search_cache[(start, blocked)] = (distances, predecessors)
+        return distances, predecessors
+    
+    def dijkstra_path(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, max_iterations: int = 10000) -> Optional[List[Tuple[int, int]]]:
+        """
+        Dijkstra para encontrar el camino de menor costo.
+        Trata minas como bloqueadas y evita posiciones ocupadas por compañeros de equipo.
+        OPTIMIZADO: reutiliza la búsqueda con la que find_best_resource eligió el objetivo
+        si su camino no pasa por ninguna celda bloqueada ahora
+        """
+        if start == target:
+            return [start]
+        
+        # Memoria de caminos del tick actual (incluye los "sin camino", que son los más caros)
+        tick = self.get_current_tick()
+        if tick != self._path_cache_tick:
+            self._path_cache.clear()
+            self._path_cache_tick = tick
+        
+        blocked = self._blocked_key(vehicle_id, planned_moves)
+        key = (start, target, blocked, max_iterations)
+        if key in self._path_cache:
+            return self._path_cache[key]
+        
+        # Reutilizar una búsqueda previa de este update() con el mismo origen y bloqueos
+        path = None
+        cached = self._search_cache.get((start, blocked))
+        if cached is not None and target in cached[0]:
+            path = self._reconstruct_path(cached[1], target)
+        elif blocked:
+            # La búsqueda de la primera pasada (sin bloqueos) sigue siendo de costo mínimo si su
+            # camino no atraviesa ninguna celda bloqueada: bloquear celdas nunca acorta caminos
+            cached = self._search_cache.get((start, frozenset()))
+            if cached is not None and target in cached[0]:
+                path = self._reconstruct_path(cached[1], target)
+                if not blocked.isdisjoint(path[1:-1]):
+                    path = None
+        if path is None:
+            # Un solo objetivo: A* con Manhattan explora mucho menos que Dijkstra
+            path = self.astar_path(start, target, player, vehicle_id, planned_moves, max_iterations)
+        
+        # Acotar memoria: descartar el camino más antiguo
+        if len(self._path_cache) >= self.PATH_CACHE_MAX:
+            del self._path_cache[next(iter(self._path_cache))]
+        self._path_cache[key] = path
+        return path
+    
     def dijkstra_distance(self, start: Tuple[int, int], target: Tuple[int, int], player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None) -> float:
         """
         Calcula la distancia de costo mínimo usando Dijkstra entre dos posiciones.
@@ -170,6 +512,8 @@ class Strategy2:
     def find_enemy_trucks(self, player) -> List[Tuple[int, int]]:
         """
         Encuentra todos los camiones enemigos en el mapa que no estén destruidos
+        OPTIMIZADO: recorre los vehículos del jugador enemigo en lugar de escanear todo el mapa;
+        el escaneo completo queda solo como respaldo si el enemigo no expone sus vehículos
         """
         enemy_trucks = []
         if not self.enemy_player:
@@ -177,10 +521,31 @@ class Strategy2:
         
         current_player_ids = set(player.vehicles.keys()) if hasattr(player, "vehicles") else set()
         
-        for row in range(self.map.rows):
-            for col in range(self.map.cols):
-                node = self.map.graph.get_node(row, col)
-                if node and (node.state == "vehicle" or node.state in ("base_p1", "base_p2")) and node.content:
+        enemy_vehicles = getattr(self.enemy_player, "vehicles", None)
+        if isinstance(enemy_vehicles, dict):
+            for enemy_id, enemy in enemy_vehicles.items():
+                # Mismo criterio que el escaneo: se ignoran ids que coinciden con los propios
+                if enemy_id in current_player_ids:
+                    continue
+                if getattr(enemy, "type", None) != "camion" or getattr(enemy, "status", None) == "destroyed":
+                    continue
+                pos = getattr(enemy, "position", None)
+                if pos and len(pos) == 2:
+                    enemy_trucks.append((pos[0], pos[1]))
+            # Mismo orden que el escaneo fila por fila (importa para desempates)
+            enemy_trucks.sort()
+            return enemy_trucks
+        
+        # Respaldo: una pasada por las filas de la grilla; el estado se filtra antes de
+        # mirar el contenido, que solo tienen las pocas celdas con vehículo o base
+        graph = self.map.graph
+        grid = getattr(graph, "grid", None)
+        if not grid:
+            grid = [[graph.get_node(row, col) for col in range(self.map.cols)] for row in range(self.map.rows)]
+        vehicle_states = self._VEHICLE_STATES
+        for row, row_nodes in enumerate(grid):
+            for col, node in enumerate(row_nodes):
+                if node and node.state in vehicle_states and node.content:
                     vehicle_content = node.content
                     vehicle_id = None
                     vehicle_obj = None
@@ -205,7 +570,7 @@ class Strategy2:
         
         return enemy_trucks
     
-    def find_best_resource(self, vehicle, resources: List, player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, assigned_targets: Set[Tuple[int, int]] = None) -> Optional[Tuple[object, Tuple[int, int]]]:
+    def find_best_resource(self, vehicle, resources: "List | ResourceIndex", player, vehicle_id: str, planned_moves: Dict[str, Tuple[int, int]] = None, assigned_targets: Set[Tuple[int, int]] = None) -> Optional[Tuple[object, Tuple[int, int]]]:
         """
         Encuentra el mejor recurso: mayor valor, en empate el más cercano según Dijkstra.
         Solo considera recursos que el vehículo puede recoger.
@@ -213,6 +578,9 @@ class Strategy2:
         Busca en TODO el mapa sin restricciones de distancia.
         OPTIMIZADO: usa heurística Manhattan para priorizar recursos y reducir Dijkstra innecesarios
         """
+        if not isinstance(resources, ResourceIndex):
+            resources = ResourceIndex(resources, self.map.graph, self._can_pick_cache)
+        
         if not resources:
             return None
         
@@ -225,80 +593,41 @@ class Strategy2:
         best_value = -1
         best_distance = float('inf')
         
-        # Lista de candidatos por valor
-        candidates_by_value: Dict[int, List] = {}
+        # Índices de candidatos agrupados por valor
+        candidates_by_value: Dict[int, List[int]] = {}
         
-        for resource in resources:
-            res_pos = None
-            if hasattr(resource, "position"):
-                res_pos = resource.position
-            elif isinstance(resource, dict):
-                res_pos = resource.get("position")
-            
-            if not res_pos or len(res_pos) != 2:
-                continue
-            
-            res_x, res_y = res_pos[0], res_pos[1]
-            res_row, res_col = res_y, res_x
-            
-            node = self.map.graph.get_node(res_row, res_col)
-            if not node or node.state != "resource":
-                continue
-            
-            if (res_row, res_col) in assigned_targets:
-                continue
-            
-            if hasattr(resource, "puntos"):
-                value = resource.puntos
-            elif isinstance(resource, dict):
-                value = resource.get("puntos", resource.get("value", 1))
-            else:
-                value = 1
-            
-            if hasattr(resource, "tipo"):
-                res_type = resource.tipo
-            elif isinstance(resource, dict):
-                res_type = resource.get("tipo", resource.get("subtype"))
-            else:
-                res_type = None
-            
-            # Verificar si el vehículo puede recoger este tipo de recurso
-            if res_type and hasattr(vehicle, "can_pick") and not vehicle.can_pick(res_type):
+        # Solo recursos que el vehículo puede recoger (máscara precalculada por tipo de vehículo)
+        pick_mask = resources.pick_mask(vehicle)
+        positions = resources.positions
+        values = resources.values
+        
+        for i in range(len(resources)):
+            if not pick_mask[i] or positions[i] in assigned_targets:
                 continue
-            
-            if value not in candidates_by_value:
-                candidates_by_value[value] = []
-            
-            manhattan_dist = abs(vehicle_pos[0] - res_row) + abs(vehicle_pos[1] - res_col)
-            candidates_by_value[value].append({
-                'resource': resource,
-                'pos': (res_row, res_col),
-                'manhattan': manhattan_dist
-            })
-        
-        # Procesar candidatos en orden de valor (mayor a menor)
+            candidates_by_value.setdefault(values[i], []).append(i)
+        
+        v_row, v_col = vehicle_pos
+        
+        # Procesar grupos en orden de valor (mayor a menor); se corta en el primero alcanzable,
+        # así que la distancia Manhattan solo se calcula para los grupos que se revisan
         for value in sorted(candidates_by_value.keys(), reverse=True):
-            candidates = candidates_by_value[value]
-            
-            candidates.sort(key=lambda x: x['manhattan'])
-            
-            # Solo hacer Dijkstra en los 3 más cercanos
-            max_dijkstra_checks = min(3, len(candidates))
-            
-            for candidate in candidates[:max_dijkstra_checks]:
-                res_pos = candidate['pos']
-                
-                # Calcular distancia usando Dijkstra
-                distance = self.dijkstra_distance(vehicle_pos, res_pos, player, vehicle_id, planned_moves)
+            # Solo hacer Dijkstra en los 3 más cercanos (estable, igual que ordenar y cortar),
+            # con una sola búsqueda multi-objetivo
+            checked = heapq.nsmallest(3, candidates_by_value[value],
+                                      key=lambda i: abs(v_row - positions[i][0]) + abs(v_col - positions[i][1]))
+            distances, _ = self._search_from(vehicle_pos, {positions[i] for i in checked}, player, vehicle_id, planned_moves)
+            
+            for i in checked:
+                res_pos = positions[i]
                 
+                distance = distances.get(res_pos, -1)
                 if distance < 0:
                     continue
                 
-                # Si encontramos uno del mejor valor, retornarlo inmediatamente
                 if value > best_value or (value == best_value and distance < best_distance):
                     best_value = value
                     best_distance = distance
-                    best_resource = candidate['resource']
+                    best_resource = resources.resources[i]
                     best_pos = res_pos
             
             if best_resource:
@@ -340,9 +669,12 @@ class Strategy2:
         closest_truck = None
         min_distance = float('inf')
         
-        for truck_info in available_trucks[:max_checks]:
+        checked = available_trucks[:max_checks]
+        distances, _ = self._search_from(vehicle_pos, {t['pos'] for t in checked}, player, vehicle_id, planned_moves)
+        
+        for truck_info in checked:
             truck_pos = truck_info['pos']
-            distance = self.dijkstra_distance(vehicle_pos, truck_pos, player, vehicle_id, planned_moves)
+            distance = distances.get(truck_pos, -1)
             if distance >= 0 and distance < min_distance:
                 min_distance = distance
                 closest_truck = truck_pos
@@ -399,9 +731,10 @@ class Strategy2:
         """
         Obtiene un movimiento seguro exploratorio cuando no hay objetivos.
         Intenta moverse hacia el centro del mapa o explorar áreas no visitadas.
+        OPTIMIZADO: el orden aleatorio sale de una tabla de permutaciones precalculada
+        en lugar de barajar listas en cada llamada
         """
         row, col = vehicle.position
-        import random
         
         # Calcular dirección hacia el centro del mapa
         center_row = self.map.rows // 2
@@ -419,11 +752,9 @@ class Strategy2:
         elif col > center_col:
             preferred_directions.append((0, -1))
         
-        # Todas las direcciones posibles
-        all_directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        
-        # Intentar primero direcciones preferidas
-        random.shuffle(preferred_directions)
+        # Intentar primero direcciones preferidas (a lo sumo dos: basta con invertirlas al azar)
+        if len(preferred_directions) == 2 and random.getrandbits(1):
+            preferred_directions.reverse()
         for dr, dc in preferred_directions:
             new_row = row + dr
             new_col = col + dc
@@ -433,8 +764,7 @@ class Strategy2:
                 return (new_row, new_col)
         
         # Si no funcionó, intentar cualquier dirección
-        random.shuffle(all_directions)
-        for dr, dc in all_directions:
+        for dr, dc in DIR_PERMS[random.randrange(24)]:
             new_row = row + dr
             new_col = col + dc
             
@@ -486,27 +816,15 @@ class Strategy2:
             return
         
         vehicles = player.vehicles
+        # Las búsquedas memorizadas solo valen mientras el mapa no cambie (un update() por tick)
+        self._search_cache.clear()
+        self._path_cache.clear()
+        self._cell_mask_key = (-1, None)
         
         # Leer todos los recursos del mapa en cada ejecución
         resources = []
         if hasattr(self.map, 'all_resources') and callable(self.map.all_resources):
             resources = self.map.all_resources()
-            # Filtrar recursos que realmente existen en el mapa
-            valid_resources = []
-            for res in resources:
-                if hasattr(res, "position"):
-                    res_pos = res.position
-                elif isinstance(res, dict):
-                    res_pos = res.get("position")
-                else:
-                    continue
-                if res_pos and len(res_pos) == 2:
-                    res_x, res_y = res_pos[0], res_pos[1]
-                    res_row, res_col = res_y, res_x
-                    node = self.map.graph.get_node(res_row, res_col)
-                    if node and node.state == "resource":
-                        valid_resources.append(res)
-            resources = valid_resources
         else:
             for row in range(self.map.rows):
                 for col in range(self.map.cols):
@@ -520,6 +838,9 @@ class Strategy2:
                                 content['position'] = (col, row)
                             resources.append(content)
         
+        # Normalizar los recursos una sola vez por tick (valida que sigan en el mapa)
+        resources = ResourceIndex(resources, self.map.graph, self._can_pick_cache)
+        
         # Encontrar camiones enemigos
         enemy_trucks = self.find_enemy_trucks(player)
         
@@ -603,19 +924,7 @@ class Strategy2:
             
             # Si el vehículo está en la base SIN objetivo, verificar si es porque no hay recursos
             if vehicle_status == "in_base" and target_pos is None:
-                can_pick_any = False
-                if hasattr(vehicle, "can_pick"):
-                    for res in resources:
-                        if hasattr(res, "tipo"):
-                            res_type = res.tipo
-                        elif isinstance(res, dict):
-                            res_type = res.get("tipo", res.get("subtype"))
-                        else:
-                            continue
-                        
-                        if res_type and vehicle.can_pick(res_type):
-                            can_pick_any = True
-                            break
+                can_pick_any = resources.can_pick_any(vehicle)
                 
                 if not can_pick_any:
                     vehicle.status = "job_done"
@@ -655,19 +964,7 @@ class Strategy2:
                             player.score += collected
                         vehicle.arrive_base()
                         
-                        can_pick_any = False
-                        if hasattr(vehicle, "can_pick"):
-                            for res in resources:
-                                if hasattr(res, "tipo"):
-                                    res_type = res.tipo
-                                elif isinstance(res, dict):
-                                    res_type = res.get("tipo", res.get("subtype"))
-                                else:
-                                    continue
-                                
-                                if res_type and vehicle.can_pick(res_type):
-                                    can_pick_any = True
-                                    break
+                        can_pick_any = resources.can_pick_any(vehicle)
                         
                         if can_pick_any and len(assigned_targets) < len(resources):
                             vehicle.status = "in_base"
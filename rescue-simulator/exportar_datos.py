@@ -6,6 +6,9 @@ import csv
 from pathlib import Path
 from datetime import datetime
 
+# Formato del sufijo de fecha de los archivos exportados
+TIMESTAMP_FMT = "%Y%m%d_%H%M%S"
+
 def main():
     # ✅ Usar ruta absoluta basada en la ubicación del script
     script_dir = Path(__file__).resolve().parent
@@ -58,10 +61,124 @@ def get_table_columns(cursor, table_name):
     return columns
 
 
+# Consulta de exportación ya armada por variante de esquema: (has_collisions, has_mine_hits) -> SQL
+_SQL_CACHE = {}
+
+
+def get_export_query(has_collisions: bool, has_mine_hits: bool) -> str:
+    """Devuelve la consulta unificada para el esquema dado; cada variante se arma una sola vez"""
+    key = (has_collisions, has_mine_hits)
+    if key in _SQL_CACHE:
+        return _SQL_CACHE[key]
+    
+    collisions_col = "vs.collisions" if has_collisions else "0"
+    mine_hits_col = "vs.mine_hits" if has_mine_hits else "0"
+    
+    # Las métricas por jugador se calculan una vez por fila de player_stats (CTE materializada)
+    # y no una vez por cada vehículo que agrega el LEFT JOIN
+    query = f"""
+        WITH jugadores AS MATERIALIZED (
+            SELECT 
+                -- Información de la Simulación
+                s.simulation_id,
+                s.status as estado_simulacion,
+                s.winner as ganador,
+                s.total_ticks as ticks_totales,
+                s.duration_seconds as duracion_segundos,
+                ROUND(s.duration_seconds / 60.0, 2) as duracion_minutos,
+                s.started_at as fecha_inicio,
+                s.finished_at as fecha_fin,
+                s.end_reason as razon_finalizacion,
+                
+                -- Información del Jugador
+                ps.player_name as jugador,
+                ps.final_score as puntaje_final,
+                ps.resources_collected as recursos_recolectados,
+                ps.vehicles_destroyed as vehiculos_destruidos,
+                ps.vehicles_survived as vehiculos_sobrevivientes,
+                ps.total_distance_traveled as distancia_total,
+                ps.collisions as colisiones,
+                ps.mine_hits as impactos_minas,
+                
+                -- Métricas Calculadas
+                CASE 
+                    WHEN s.winner = ps.player_name THEN 'Victoria'
+                    WHEN s.winner IS NULL THEN 'Empate'
+                    ELSE 'Derrota'
+                END as resultado,
+                
+                ROUND(CAST(ps.resources_collected AS FLOAT) / NULLIF(s.total_ticks, 0), 4) as recursos_por_tick,
+                ROUND(CAST(ps.total_distance_traveled AS FLOAT) / NULLIF(s.total_ticks, 0), 4) as distancia_por_tick,
+                
+                -- Porcentajes
+                ROUND(CAST(ps.vehicles_survived AS FLOAT) / NULLIF(ps.vehicles_destroyed + ps.vehicles_survived, 0) * 100, 2) as porcentaje_supervivencia,
+                ROUND(CAST(ps.collisions AS FLOAT) / NULLIF(ps.total_distance_traveled, 0) * 100, 4) as tasa_colisiones,
+                ROUND(CAST(ps.mine_hits AS FLOAT) / NULLIF(ps.total_distance_traveled, 0) * 100, 4) as tasa_impactos_minas
+                
+            FROM simulations s
+            INNER JOIN player_stats ps ON s.simulation_id = ps.simulation_id
+        )
+        SELECT 
+            j.simulation_id,
+            j.estado_simulacion,
+            j.ganador,
+            j.ticks_totales,
+            j.duracion_segundos,
+            j.duracion_minutos,
+            j.fecha_inicio,
+            j.fecha_fin,
+            j.razon_finalizacion,
+            
+            j.jugador,
+            j.puntaje_final,
+            j.recursos_recolectados,
+            j.vehiculos_destruidos,
+            j.vehiculos_sobrevivientes,
+            j.distancia_total,
+            j.colisiones,
+            j.impactos_minas,
+            
+            -- Información del Vehículo
+            vs.vehicle_id as id_vehiculo,
+            vs.vehicle_type as tipo_vehiculo,
+            vs.status as estado_vehiculo,
+            vs.distance_traveled as distancia_vehiculo,
+            vs.resources_collected as recursos_vehiculo,
+            {collisions_col} as colisiones_vehiculo,
+            {mine_hits_col} as impactos_minas_vehiculo,
+            
+            j.resultado,
+            j.recursos_por_tick,
+            j.distancia_por_tick,
+            ROUND(CAST(vs.resources_collected AS FLOAT) / NULLIF(vs.distance_traveled, 0), 4) as eficiencia_vehiculo,
+            j.porcentaje_supervivencia,
+            j.tasa_colisiones,
+            j.tasa_impactos_minas
+            
+        FROM jugadores j
+        LEFT JOIN vehicle_stats vs ON j.simulation_id = vs.simulation_id 
+                                    AND j.jugador = vs.player_name
+        ORDER BY j.fecha_inicio DESC, j.jugador, vs.vehicle_id
+    """
+    _SQL_CACHE[key] = query
+    return query
+
+
 def exportar_datos_unificados(db_path: Path, exports_dir: Path):
-    """Exporta TODOS los datos en UN SOLO archivo CSV unificado"""
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    """
+    Exporta TODOS los datos en UN SOLO archivo CSV unificado
+    OPTIMIZADO: escribe las filas como tuplas por bloques (fetchmany + writerows),
+    sin armar un dict por fila ni cargar todo el resultado en memoria; los conteos
+    de simulaciones y jugadores únicos los resuelve SQLite con COUNT(DISTINCT).
+    La base se abre en solo lectura con lectura por mmap
+    """
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.executescript("""
+        PRAGMA query_only=1;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+        PRAGMA temp_store=MEMORY;
+    """)
     cursor = conn.cursor()
     
     # 🔍 Verificar columnas disponibles
@@ -73,7 +190,7 @@ def exportar_datos_unificados(db_path: Path, exports_dir: Path):
     has_collisions = 'collisions' in vehicle_cols
     has_mine_hits = 'mine_hits' in vehicle_cols
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now().strftime(TIMESTAMP_FMT)
     output_file = exports_dir / f"estadisticas_completas_{timestamp}.csv"
     
     print("=" * 70)
@@ -82,88 +199,40 @@ def exportar_datos_unificados(db_path: Path, exports_dir: Path):
     print()
     
     # 🔥 CONSULTA UNIFICADA adaptada al esquema real
-    collisions_col = "vs.collisions" if has_collisions else "0"
-    mine_hits_col = "vs.mine_hits" if has_mine_hits else "0"
+    query = get_export_query(has_collisions, has_mine_hits)
     
-    query = f"""
-        SELECT 
-            -- Información de la Simulación
-            s.simulation_id,
-            s.status as estado_simulacion,
-            s.winner as ganador,
-            s.total_ticks as ticks_totales,
-            s.duration_seconds as duracion_segundos,
-            ROUND(s.duration_seconds / 60.0, 2) as duracion_minutos,
-            s.started_at as fecha_inicio,
-            s.finished_at as fecha_fin,
-            s.end_reason as razon_finalizacion,
-            
-            -- Información del Jugador
-            ps.player_name as jugador,
-            ps.final_score as puntaje_final,
-            ps.resources_collected as recursos_recolectados,
-            ps.vehicles_destroyed as vehiculos_destruidos,
-            ps.vehicles_survived as vehiculos_sobrevivientes,
-            ps.total_distance_traveled as distancia_total,
-            ps.collisions as colisiones,
-            ps.mine_hits as impactos_minas,
-            
-            -- Información del Vehículo
-            vs.vehicle_id as id_vehiculo,
-            vs.vehicle_type as tipo_vehiculo,
-            vs.status as estado_vehiculo,
-            vs.distance_traveled as distancia_vehiculo,
-            vs.resources_collected as recursos_vehiculo,
-            {collisions_col} as colisiones_vehiculo,
-            {mine_hits_col} as impactos_minas_vehiculo,
-            
-            -- Métricas Calculadas
-            CASE 
-                WHEN s.winner = ps.player_name THEN 'Victoria'
-                WHEN s.winner IS NULL THEN 'Empate'
-                ELSE 'Derrota'
-            END as resultado,
-            
-            ROUND(CAST(ps.resources_collected AS FLOAT) / NULLIF(s.total_ticks, 0), 4) as recursos_por_tick,
-            ROUND(CAST(ps.total_distance_traveled AS FLOAT) / NULLIF(s.total_ticks, 0), 4) as distancia_por_tick,
-            ROUND(CAST(vs.resources_collected AS FLOAT) / NULLIF(vs.distance_traveled, 0), 4) as eficiencia_vehiculo,
-            
-            -- Porcentajes
-            ROUND(CAST(ps.vehicles_survived AS FLOAT) / NULLIF(ps.vehicles_destroyed + ps.vehicles_survived, 0) * 100, 2) as porcentaje_supervivencia,
-            ROUND(CAST(ps.collisions AS FLOAT) / NULLIF(ps.total_distance_traveled, 0) * 100, 4) as tasa_colisiones,
-            ROUND(CAST(ps.mine_hits AS FLOAT) / NULLIF(ps.total_distance_traveled, 0) * 100, 4) as tasa_impactos_minas
-            
+    # Conteos únicos en la base de datos (mismo JOIN que la consulta principal)
+    cursor.execute("""
+        SELECT COUNT(DISTINCT s.simulation_id), COUNT(DISTINCT ps.player_name)
         FROM simulations s
         INNER JOIN player_stats ps ON s.simulation_id = ps.simulation_id
-        LEFT JOIN vehicle_stats vs ON ps.simulation_id = vs.simulation_id 
-                                    AND ps.player_name = vs.player_name
-        ORDER BY s.started_at DESC, ps.player_name, vs.vehicle_id
-    """
+    """)
+    simulaciones_unicas, jugadores_unicos = cursor.fetchone()
     
+    cursor.arraysize = 10_000
     cursor.execute(query)
-    rows = cursor.fetchall()
+    fieldnames = [col[0] for col in cursor.description]
+    chunk = cursor.fetchmany()
     
-    if not rows:
+    if not chunk:
         print("⚠️  No hay datos para exportar")
         conn.close()
         return
     
-    # Escribir CSV
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = rows[0].keys()
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    total_rows = 0
+    
+    # Escribir CSV por bloques, con un buffer de 1 MiB para hacer pocas escrituras al disco
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
         
-        for row in rows:
-            writer.writerow(dict(row))
+        while chunk:
+            writer.writerows(chunk)
+            total_rows += len(chunk)
+            chunk = cursor.fetchmany()
     
     conn.close()
     
-    # Estadísticas del archivo generado
-    total_rows = len(rows)
-    simulaciones_unicas = len(set(row['simulation_id'] for row in rows))
-    jugadores_unicos = len(set(row['jugador'] for row in rows))
-    
     print("=" * 70)
     print("  ✅ EXPORTACIÓN COMPLETADA EXITOSAMENTE")
     print("=" * 70)
@@ -54,6 +54,9 @@ def main():
         print(f"  Simulaciones completadas: {summary.get('completed_simulations', 0)}")
     except Exception as e:
         print(f"  ⚠️  Error al leer estadísticas: {e}")
+    finally:
+        # Liberar sus conexiones: si siguen abiertas bloquean el borrado
+        pm.close()
     
     # Confirmación
     print("\n" + "=" * 70)
@@ -71,6 +74,8 @@ def main():
         print("\n❌ Operación cancelada")
         return
     
+    # Una sola conexión para contar, borrar y verificar
+    conn = None
     try:
         print("\n🗑️  Iniciando limpieza...")
         print("-" * 70)
@@ -80,24 +85,27 @@ def main():
         conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
         
-        # Contar antes
-        cursor.execute("SELECT COUNT(*) FROM simulations")
-        total_sims = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM player_stats")
-        total_stats = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM vehicle_stats")
-        total_vehicles = cursor.fetchone()[0]
+        # Contar antes (las tres tablas en una sola consulta)
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM simulations),
+                   (SELECT COUNT(*) FROM player_stats),
+                   (SELECT COUNT(*) FROM vehicle_stats)
+        """)
+        total_sims, total_stats, total_vehicles = cursor.fetchone()
         
-        # Eliminar en orden (respetando integridad referencial)
-        cursor.execute("DELETE FROM vehicle_stats")
-        cursor.execute("DELETE FROM simulation_events")
-        cursor.execute("DELETE FROM player_stats")
-        cursor.execute("DELETE FROM simulations")
-        
-        conn.commit()
-        conn.close()
+        # Eliminar en orden (respetando integridad referencial), en una sola transacción
+        # y sin sincronizar a disco cada paso: es un borrado total, no hay nada que preservar.
+        # El modo de journal (WAL, persistente) no se toca
+        cursor.executescript("""
+            PRAGMA synchronous=OFF;
+            PRAGMA temp_store=MEMORY;
+            BEGIN IMMEDIATE;
+            DELETE FROM vehicle_stats;
+            DELETE FROM simulation_events;
+            DELETE FROM player_stats;
+            DELETE FROM simulations;
+            COMMIT;
+        """)
         
         print(f"   ✅ Eliminadas {total_sims} simulaciones")
         print(f"   ✅ Eliminadas {total_stats} estadísticas de jugadores")
@@ -107,11 +115,8 @@ def main():
         print("\n2️⃣  Verificando resultado...")
         
         # Verificar base de datos
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM simulations")
         remaining = cursor.fetchone()[0]
-        conn.close()
         
         if remaining == 0:
             print("   ✅ Base de datos limpiada correctamente")
@@ -131,6 +136,9 @@ def main():
         traceback.print_exc()
         print("\n⚠️  La limpieza puede haber quedado incompleta.")
         print("   Verifica manualmente la base de datos si es necesario.")
+    finally:
+        if conn is not None:
+            conn.close()
 
 if __name__ == "__main__":
     try:
@@ -10,12 +10,13 @@ para el simulador de rescate, incluyendo:
 - Gestor principal unificado (PersistenceManager)
 """
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, SimulationConfig
 from .simulation_history import SimulationHistory
 from .persistence_manager import PersistenceManager
 
 __all__ = [
     'ConfigManager',
+    'SimulationConfig',
     'SimulationHistory',
     'PersistenceManager'
 ]
@@ -11,12 +11,96 @@ Responsabilidades:
 - Validar configuraciones al cargar
 """
 
+import copy
+import hashlib
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
+# orjson es opcional: si no está instalado se usa el módulo json estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Serializa a JSON indentado (2 espacios, UTF-8) usando orjson si está disponible"""
+    if orjson is None:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=256)
+def _parse_config_file(filepath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Lee y parsea un archivo de configuración.
+    mtime_ns y size forman parte de la clave del cache: si el archivo cambia,
+    la siguiente llamada no encuentra la entrada y lo vuelve a leer.
+    El resultado es compartido, no debe modificarse.
+    """
+    return json.loads(Path(filepath).read_bytes())
+
+
+def _config_digest(data: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Huella (blake2b de 16 bytes) del contenido de una configuración, independiente
+    del orden de las claves. Devuelve None si no se puede calcular.
+    """
+    try:
+        if orjson is None:
+            encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        else:
+            encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _write_atomic(filepath, data: bytes):
+    """
+    Escribe el archivo de forma atómica: primero en un temporal y luego lo renombra.
+    Si el proceso se interrumpe a mitad de la escritura, el archivo original queda intacto.
+    """
+    filepath = os.fspath(filepath)
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+
+class SimulationConfig:
+    """
+    Configuración de una simulación ya validada.
+    Se arma una vez y expone filas/columnas como atributos, sin recorrer
+    el diccionario en cada uso.
+    """
+    
+    __slots__ = ("rows", "cols", "raw")
+    
+    def __init__(self, rows: int = 50, cols: int = 50,
+                 raw: Optional[Dict[str, Any]] = None):
+        self.rows = rows
+        self.cols = cols
+        # Diccionario completo tal como se guarda en disco y en el historial
+        self.raw = raw if raw is not None else {"map": {"rows": rows, "cols": cols}}
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "SimulationConfig":
+        """Crea la configuración a partir de un diccionario con la forma {"map": {...}, ...}"""
+        map_config = config.get("map", {})
+        return cls(map_config.get("rows", 50), map_config.get("cols", 50), config)
+    
+    @classmethod
+    def coerce(cls, config: Union["SimulationConfig", Dict[str, Any]]) -> "SimulationConfig":
+        """Devuelve la configuración como SimulationConfig, convirtiéndola si es un diccionario"""
+        if isinstance(config, cls):
+            return config
+        return cls.from_dict(config)
+
 
 class ConfigManager:
     """
@@ -24,6 +108,17 @@ class ConfigManager:
     Utiliza JSON para almacenar configuraciones de forma legible.
     """
     
+    # Reglas de validación, construidas una sola vez para todas las llamadas
+    REQUIRED_FIELDS = ("type", "created_at")
+    VALID_TYPES = frozenset(("map", "strategy", "simulation"))
+    
+    # Ninguna configuración válida ocupa menos que esto (p. ej. archivos vacíos por una escritura interrumpida)
+    MIN_CONFIG_SIZE = 16
+    
+    # Prefijo con el que save_map_config / save_strategy_config nombran sus archivos.
+    # Las simulaciones pueden tener un nombre libre, así que no tienen prefijo fijo.
+    TYPE_PREFIXES = {"map": "map_", "strategy": "strategy_"}
+    
     def __init__(self, base_dir: Optional[Path] = None):
         """
         Inicializa el gestor de configuraciones.
@@ -40,10 +135,19 @@ class ConfigManager:
         self.base_dir = Path(base_dir)
         self.configs_dir = self.base_dir / "saved_configs"
         self.configs_dir.mkdir(parents=True, exist_ok=True)
+        # Prefijo como str para armar las rutas de guardado sin crear objetos Path
+        self._configs_prefix = str(self.configs_dir) + os.sep
         
         # Archivo de configuración activa
         self.active_config_file = self.base_dir / "active_config.json"
         
+        # Cache del directorio de configuraciones para list_configs:
+        # nombre_archivo -> (mtime_ns, tamaño, configuración o None si es inválida)
+        self._dir_cache: Dict[str, tuple] = {}
+        
+        # Huella de la última configuración activa escrita por esta instancia
+        self._last_active_digest: Optional[bytes] = None
+        
     def save_map_config(self, name: str, rows: int, cols: int, 
                        seed: Optional[int] = None,
                        mine_config: Optional[Dict] = None) -> str:
@@ -60,10 +164,12 @@ class ConfigManager:
         Returns:
             Path del archivo guardado
         """
+        # Una sola lectura del reloj para la fecha y el nombre del archivo
+        now = datetime.now()
         config = {
             "type": "map",
             "name": name,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "parameters": {
                 "rows": rows,
                 "cols": cols,
@@ -72,13 +178,13 @@ class ConfigManager:
             "mine_config": mine_config or {}
         }
         
-        filename = f"map_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        filepath = self.configs_dir / filename
+        filename = f"map_{name}_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        filepath = self._configs_prefix + filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_atomic(filepath, _dump_json_bytes(config))
+        self._invalidate_cache(filepath)
         
-        return str(filepath)
+        return filepath
     
     def save_strategy_config(self, player_name: str, strategy_name: str,
                             strategy_params: Dict[str, Any]) -> str:
@@ -93,21 +199,22 @@ class ConfigManager:
         Returns:
             Path del archivo guardado
         """
+        now = datetime.now()
         config = {
             "type": "strategy",
             "player": player_name,
             "strategy": strategy_name,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "parameters": strategy_params
         }
         
-        filename = f"strategy_{player_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        filepath = self.configs_dir / filename
+        filename = f"strategy_{player_name}_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        filepath = self._configs_prefix + filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_atomic(filepath, _dump_json_bytes(config))
+        self._invalidate_cache(filepath)
         
-        return str(filepath)
+        return filepath
     
     def save_simulation_config(self, config_data: Dict[str, Any],
                                name: Optional[str] = None) -> str:
@@ -121,23 +228,24 @@ class ConfigManager:
         Returns:
             Path del archivo guardado
         """
+        now = datetime.now()
         if name is None:
-            name = f"sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            name = f"sim_{now.strftime('%Y%m%d_%H%M%S')}"
         
         config = {
             "type": "simulation",
             "name": name,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "parameters": config_data
         }
         
         filename = f"{name}.json"
-        filepath = self.configs_dir / filename
+        filepath = self._configs_prefix + filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_atomic(filepath, _dump_json_bytes(config))
+        self._invalidate_cache(filepath)
         
-        return str(filepath)
+        return filepath
     
     def load_config(self, filepath: str) -> Dict[str, Any]:
         """
@@ -153,13 +261,30 @@ class ConfigManager:
             FileNotFoundError: Si el archivo no existe
             json.JSONDecodeError: Si el archivo no es JSON válido
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        return self._load_config_stat(filepath, os.stat(filepath))
+    
+    def _load_config_stat(self, filepath: str, st: os.stat_result) -> Dict[str, Any]:
+        """
+        Igual que load_config, pero recibe el stat del archivo ya obtenido
+        (por ejemplo desde os.scandir) para no repetir la llamada al sistema.
+        """
+        # El archivo solo se vuelve a leer si cambió su mtime o su tamaño
+        config = _parse_config_file(str(filepath), st.st_mtime_ns, st.st_size)
         
         # Validar estructura básica
         self._validate_config(config)
         
-        return config
+        # Copia para que quien llama pueda modificarla sin tocar el cache
+        return copy.deepcopy(config)
+    
+    def _invalidate_cache(self, filepath):
+        """
+        Descarta lo cacheado de un archivo recién escrito o borrado.
+        El cache de parseo se vacía completo: una reescritura podría conservar
+        el mismo mtime y tamaño, y las escrituras son poco frecuentes.
+        """
+        _parse_config_file.cache_clear()
+        self._dir_cache.pop(os.path.basename(filepath), None)
     
     def _validate_config(self, config: Dict[str, Any]):
         """
@@ -171,14 +296,11 @@ class ConfigManager:
         Raises:
             ValueError: Si la configuración no es válida
         """
-        required_fields = ["type", "created_at"]
-        
-        for field in required_fields:
+        for field in self.REQUIRED_FIELDS:
             if field not in config:
                 raise ValueError(f"Configuración inválida: falta el campo '{field}'")
         
-        valid_types = ["map", "strategy", "simulation"]
-        if config["type"] not in valid_types:
+        if not isinstance(config["type"], str) or config["type"] not in self.VALID_TYPES:
             raise ValueError(f"Tipo de configuración inválido: {config['type']}")
     
     def list_configs(self, config_type: Optional[str] = None) -> list:
@@ -186,22 +308,48 @@ class ConfigManager:
         Lista todas las configuraciones guardadas.
         
         Args:
-            config_type: Filtrar por tipo (map, strategy, simulation)
+            config_type: Filtrar por tipo (map, strategy, simulation).
+                         Para map y strategy solo se consideran los archivos
+                         con el prefijo correspondiente (map_, strategy_).
             
         Returns:
             Lista de tuplas (nombre_archivo, configuración)
         """
         configs = []
-        
-        for filepath in self.configs_dir.glob("*.json"):
-            try:
-                config = self.load_config(str(filepath))
+        seen = set()
+        prefix = self.TYPE_PREFIXES.get(config_type)
+        
+        # Solo se parsean los archivos nuevos o cuyo mtime/tamaño cambió
+        with os.scandir(self.configs_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                if st.st_size < self.MIN_CONFIG_SIZE:
+                    continue
+                seen.add(entry.name)
+                if prefix is not None and not entry.name.startswith(prefix):
+                    continue
+                
+                cached = self._dir_cache.get(entry.name)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    config = cached[2]
+                else:
+                    try:
+                        config = self._load_config_stat(entry.path, st)
+                    except Exception:
+                        # Archivo inválido: se recuerda para no volver a parsearlo
+                        config = None
+                    self._dir_cache[entry.name] = (st.st_mtime_ns, st.st_size, config)
                 
+                if config is None:
+                    continue
                 if config_type is None or config.get("type") == config_type:
-                    configs.append((filepath.name, config))
-            except Exception:
-                # Ignorar archivos inválidos
-                continue
+                    configs.append((entry.name, copy.deepcopy(config)))
+        
+        # Descartar entradas de archivos que ya no existen
+        for name in [n for n in self._dir_cache if n not in seen]:
+            del self._dir_cache[name]
         
         # Ordenar por fecha de creación (más recientes primero)
         configs.sort(key=lambda x: x[1].get("created_at", ""), reverse=True)
@@ -223,6 +371,7 @@ class ConfigManager:
         try:
             if filepath.exists():
                 filepath.unlink()
+                self._invalidate_cache(filepath)
                 return True
         except Exception:
             pass
@@ -233,16 +382,24 @@ class ConfigManager:
         """
         Guarda la configuración activa actual.
         
+        Si es igual a la última guardada (y el archivo sigue existiendo) no se
+        vuelve a escribir, por lo que saved_at conserva la fecha de esa escritura.
+        
         Args:
             config_data: Datos de configuración a guardar
         """
+        digest = _config_digest(config_data)
+        if (digest is not None and digest == self._last_active_digest
+                and self.active_config_file.exists()):
+            return
+        
         config = {
             "saved_at": datetime.now().isoformat(),
             "config": config_data
         }
         
-        with open(self.active_config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_atomic(self.active_config_file, _dump_json_bytes(config))
+        self._last_active_digest = digest
     
     def load_active_config(self) -> Optional[Dict[str, Any]]:
         """
@@ -255,9 +412,8 @@ class ConfigManager:
             return None
         
         try:
-            with open(self.active_config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get("config")
+            data = json.loads(self.active_config_file.read_bytes())
+            return data.get("config")
         except Exception:
             return None
     
@@ -270,8 +426,7 @@ class ConfigManager:
             config_data: Datos a exportar
             output_path: Path de destino
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_bytes(_dump_json_bytes(config_data))
     
     def import_config(self, filepath: str) -> Dict[str, Any]:
         """
@@ -12,21 +12,110 @@ Responsabilidades:
 - Registrar partidas en base de datos
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 from datetime import datetime
-import uuid
+from collections import OrderedDict
+import copy
+import itertools
+import os
+import queue
+import threading
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, SimulationConfig
 from .simulation_history import SimulationHistory
 
+# Prefijo de los IDs de simulación, calculado una vez por proceso: fecha de inicio
+# del proceso + un token aleatorio para no chocar con otros procesos.
+# Cada simulación le agrega el siguiente valor del contador.
+_SIM_ID_PREFIX = f"sim_{datetime.now().strftime('%Y%m%d')}_{os.urandom(4).hex()}"
+_SIM_ID_COUNTER = itertools.count()
+
+
+def _record_inactive(*args, **kwargs) -> bool:
+    """Reemplaza a los record_* mientras no hay una simulación activa"""
+    return False
+
+
+def _history_writer_loop(write_queue: queue.Queue, history: SimulationHistory,
+                         failures: List[int]):
+    """
+    Hilo escritor: toma lotes de la cola y los inserta en la base de datos.
+    Junta los lotes que ya estén esperando para escribirlos en una sola transacción.
+    Usa su propia conexión (la compartida queda en el hilo principal) y la cierra
+    al recibir None.
+    """
+    try:
+        conn = history.open_connection()
+    except Exception:
+        failures.append(1)
+        return
+    try:
+        _write_batches(write_queue, history, failures, conn)
+    finally:
+        conn.close()
+
+
+def _write_batches(write_queue: queue.Queue, history: SimulationHistory,
+                   failures: List[int], conn):
+    """Cuerpo del hilo escritor: escribe lotes con conn hasta recibir None"""
+    while True:
+        item = write_queue.get()
+        if item is None:
+            write_queue.task_done()
+            return
+        
+        player_rows, event_rows, vehicle_rows = list(item[0]), list(item[1]), list(item[2])
+        taken = 1
+        stop = False
+        while taken < PersistenceManager.MAX_MERGED_BATCHES:
+            try:
+                extra = write_queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            if extra is None:
+                stop = True
+                break
+            player_rows.extend(extra[0])
+            event_rows.extend(extra[1])
+            vehicle_rows.extend(extra[2])
+        
+        if not history.add_rows_batch(player_rows, event_rows, vehicle_rows, conn=conn):
+            failures.append(1)
+        
+        for _ in range(taken):
+            write_queue.task_done()
+        if stop:
+            return
+
 
 class PersistenceManager:
     """
     Gestor principal del sistema de persistencia.
     Proporciona interfaz unificada para todas las operaciones de persistencia.
+    
+    Las estadísticas y eventos se acumulan en memoria y se escriben por lotes
+    (una transacción por lote). Al llegar a BATCH_SIZE filas el lote se pasa a un
+    hilo escritor, así el loop del juego no espera al disco. flush(), close() y
+    finish_simulation esperan a que todo lo pendiente quede escrito.
     """
     
+    # Filas pendientes a partir de las cuales se escribe el lote
+    BATCH_SIZE = 256
+    
+    # Lotes que pueden esperar en la cola del hilo escritor (si se llena, record_* espera)
+    WRITE_QUEUE_SIZE = 64
+    
+    # Máximo de lotes encolados que el hilo escritor junta en una transacción
+    MAX_MERGED_BATCHES = 8
+    
+    # Cantidad de resultados de get_simulation_history (por limit) que se guardan
+    HISTORY_CACHE_SIZE = 8
+    
+    # Métodos que solo registran datos con una simulación activa
+    RECORD_METHODS = ("record_player_stats", "record_vehicle_stats", "record_event")
+    
     def __init__(self, base_dir: Optional[Path] = None):
         """
         Inicializa el gestor de persistencia.
@@ -46,30 +135,52 @@ class PersistenceManager:
         # ID de simulación actual
         self.current_simulation_id: Optional[str] = None
         
-    def start_new_simulation(self, config: Dict[str, Any]) -> str:
+        # Filas pendientes de escribir en la base de datos
+        self._player_stats_buf: List[tuple] = []
+        self._event_buf: List[tuple] = []
+        self._vehicle_stats_buf: List[tuple] = []
+        
+        # Hilo escritor (se inicia con el primer lote) y su cola de lotes
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._write_failures: List[int] = []
+        
+        # Cache de consultas sobre la tabla simulations. Solo la modifican
+        # start/finish/cleanup, así que se invalida ahí (no en cada record_*).
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._history_cache: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        
+        # Sin simulación activa los record_* no hacen nada
+        self._set_recording(False)
+        
+    def start_new_simulation(self, config: Union[SimulationConfig, Dict[str, Any]]) -> str:
         """
         Inicia una nueva simulación y la registra en el historial.
         
         Args:
-            config: Configuración de la simulación
+            config: Configuración de la simulación (SimulationConfig o diccionario)
             
         Returns:
             ID único de la simulación
         """
         # Generar ID único
-        simulation_id = f"sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        simulation_id = f"{_SIM_ID_PREFIX}_{next(_SIM_ID_COUNTER):04d}"
         self.current_simulation_id = simulation_id
+        self._set_recording(True)
+        
+        config = SimulationConfig.coerce(config)
         
         # Guardar configuración activa
-        self.config_manager.save_active_config(config)
+        self.config_manager.save_active_config(config.raw)
         
         # Registrar inicio en el historial
-        map_config = config.get('map', {})
+        self._wait_writes()
+        self._invalidate_read_caches()
         self.history.start_simulation(
             simulation_id,
-            map_config.get('rows', 50),
-            map_config.get('cols', 50),
-            config
+            config.rows,
+            config.cols,
+            config.raw
         )
         
         return simulation_id
@@ -93,17 +204,64 @@ class PersistenceManager:
         if self.current_simulation_id is None:
             return False
         
+        # Las filas pendientes se escriben en la misma transacción que el cierre
+        self._wait_writes()
+        self._invalidate_read_caches()
         success = self.history.finish_simulation(
             self.current_simulation_id,
             total_ticks,
             winner,
             final_score_p1,
             final_score_p2,
-            end_reason
+            end_reason,
+            player_rows=self._player_stats_buf,
+            event_rows=self._event_buf,
+            vehicle_rows=self._vehicle_stats_buf
         )
         
+        self._player_stats_buf = []
+        self._event_buf = []
+        self._vehicle_stats_buf = []
         return success
     
+    def finalize(self, total_ticks: int, winner: str,
+                 final_score_p1: int, final_score_p2: int,
+                 end_reason: Optional[str] = None,
+                 player_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+                 vehicle_stats: Optional[List[tuple]] = None) -> bool:
+        """
+        Finaliza la simulación actual registrando también las estadísticas finales,
+        todo en una sola transacción.
+        
+        Args:
+            total_ticks: Total de ticks ejecutados
+            winner: Nombre del ganador
+            final_score_p1: Puntaje final jugador 1
+            final_score_p2: Puntaje final jugador 2
+            end_reason: Razón de finalización
+            player_stats: Diccionario nombre_jugador -> estadísticas (opcional)
+            vehicle_stats: Lista de tuplas (jugador, id_vehículo, tipo, estadísticas) (opcional)
+            
+        Returns:
+            True si se registró correctamente
+        """
+        if self.current_simulation_id is None:
+            return False
+        
+        sim_id = self.current_simulation_id
+        for player_name, stats in (player_stats or {}).items():
+            self._player_stats_buf.append(
+                SimulationHistory.player_stats_row(sim_id, player_name, stats)
+            )
+        for player_name, vehicle_id, vehicle_type, stats in (vehicle_stats or ()):
+            self._vehicle_stats_buf.append(
+                SimulationHistory.vehicle_stats_row(sim_id, player_name,
+                                                    vehicle_id, vehicle_type, stats)
+            )
+        
+        return self.finish_simulation(total_ticks, winner,
+                                      final_score_p1, final_score_p2, end_reason)
+    
     def record_player_stats(self, player_name: str, stats: Dict[str, Any]) -> bool:
         """
         Registra estadísticas de un jugador.
@@ -115,14 +273,10 @@ class PersistenceManager:
         Returns:
             True si se registró correctamente
         """
-        if self.current_simulation_id is None:
-            return False
-        
-        return self.history.add_player_stats(
-            self.current_simulation_id,
-            player_name,
-            stats
+        self._player_stats_buf.append(
+            SimulationHistory.player_stats_row(self.current_simulation_id, player_name, stats)
         )
+        return self._maybe_flush()
     
     def record_vehicle_stats(self, player_name: str, vehicle_id: str,
                             vehicle_type: str, stats: Dict[str, Any]) -> bool:
@@ -138,16 +292,11 @@ class PersistenceManager:
         Returns:
             True si se registró correctamente
         """
-        if self.current_simulation_id is None:
-            return False
-        
-        return self.history.add_vehicle_stats(
-            self.current_simulation_id,
-            player_name,
-            vehicle_id,
-            vehicle_type,
-            stats
+        self._vehicle_stats_buf.append(
+            SimulationHistory.vehicle_stats_row(self.current_simulation_id, player_name,
+                                                vehicle_id, vehicle_type, stats)
         )
+        return self._maybe_flush()
     
     def record_event(self, tick: int, event_type: str,
                     event_data: Optional[Dict] = None) -> bool:
@@ -162,15 +311,91 @@ class PersistenceManager:
         Returns:
             True si se registró correctamente
         """
-        if self.current_simulation_id is None:
-            return False
-        
-        return self.history.add_event(
-            self.current_simulation_id,
-            tick,
-            event_type,
-            event_data
+        self._event_buf.append(
+            SimulationHistory.event_row(self.current_simulation_id, tick, event_type, event_data)
         )
+        return self._maybe_flush()
+    
+    def _set_recording(self, active: bool):
+        """
+        Activa o desactiva los record_*. Desactivados, quedan reemplazados en la
+        instancia por una función que devuelve False; así los métodos reales no
+        necesitan comprobar en cada llamada si hay una simulación activa.
+        """
+        for name in self.RECORD_METHODS:
+            if active:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, _record_inactive)
+    
+    def _maybe_flush(self) -> bool:
+        """Pasa el lote pendiente al hilo escritor si ya alcanzó BATCH_SIZE filas"""
+        pending = len(self._player_stats_buf) + len(self._event_buf) + len(self._vehicle_stats_buf)
+        if pending >= self.BATCH_SIZE:
+            return self._enqueue_pending()
+        return True
+    
+    def _enqueue_pending(self) -> bool:
+        """
+        Entrega las filas pendientes al hilo escritor sin esperar a que se escriban.
+        Si el hilo no puede usarse, las escribe directamente.
+        """
+        if not (self._player_stats_buf or self._event_buf or self._vehicle_stats_buf):
+            return True
+        
+        batch = (self._player_stats_buf, self._event_buf, self._vehicle_stats_buf)
+        self._player_stats_buf = []
+        self._event_buf = []
+        self._vehicle_stats_buf = []
+        
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=_history_writer_loop,
+                args=(self._write_queue, self.history, self._write_failures),
+                name="history-writer",
+                daemon=True
+            )
+            self._writer.start()
+        
+        if not self._writer.is_alive():
+            return self.history.add_rows_batch(*batch)
+        
+        self._write_queue.put(batch)
+        return True
+    
+    def _wait_writes(self):
+        """Espera a que el hilo escritor termine los lotes encolados"""
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.join()
+    
+    def flush(self) -> bool:
+        """
+        Escribe en la base de datos todas las filas pendientes y espera a que terminen.
+        
+        Returns:
+            True si se registraron correctamente (o no había nada pendiente)
+        """
+        failures_before = len(self._write_failures)
+        success = self._enqueue_pending()
+        self._wait_writes()
+        return success and len(self._write_failures) == failures_before
+    
+    def close(self):
+        """Escribe lo pendiente, detiene el hilo escritor y cierra la conexión a la base de datos"""
+        self.flush()
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+        self._writer = None
+        self.history.close()
+    
+    def __del__(self):
+        try:
+            self.flush()
+            if self._writer is not None and self._writer.is_alive():
+                self._write_queue.put_nowait(None)
+        except Exception:
+            pass
     
     def get_simulation_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -182,7 +407,17 @@ class PersistenceManager:
         Returns:
             Lista de simulaciones
         """
-        return self.history.list_simulations(limit)
+        cached = self._history_cache.get(limit)
+        if cached is None:
+            # Lee con una conexión propia de solo lectura: no espera al hilo escritor,
+            # que solo escribe estadísticas y eventos (no la tabla simulations)
+            cached = self.history.list_simulations(limit)
+            self._history_cache[limit] = cached
+            if len(self._history_cache) > self.HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
+        else:
+            self._history_cache.move_to_end(limit)
+        return copy.deepcopy(cached)
     
     def get_statistics_summary(self) -> Dict[str, Any]:
         """
@@ -191,7 +426,14 @@ class PersistenceManager:
         Returns:
             Diccionario con estadísticas agregadas
         """
-        return self.history.get_statistics_summary()
+        if self._summary_cache is None:
+            self._summary_cache = self.history.get_statistics_summary()
+        return copy.deepcopy(self._summary_cache)
+    
+    def _invalidate_read_caches(self):
+        """Descarta los resultados cacheados tras modificar la tabla simulations"""
+        self._summary_cache = None
+        self._history_cache.clear()
     
     def cleanup_old_data(self, days_to_keep: int = 30) -> Dict[str, int]:
         """
@@ -203,6 +445,8 @@ class PersistenceManager:
         Returns:
             Diccionario con cantidad de elementos eliminados
         """
+        self._wait_writes()
+        self._invalidate_read_caches()
         deleted = {
             "simulations": self.history.cleanup_old_simulations(days_to_keep)
         }
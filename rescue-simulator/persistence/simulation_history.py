@@ -11,12 +11,62 @@ Responsabilidades:
 - Mantener integridad referencial de datos
 """
 
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 import json
 
+# orjson es opcional: si no está instalado se usa el módulo json estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_text(data: Any) -> str:
+    """Serializa a JSON para guardarlo en una columna TEXT (con orjson si está disponible)"""
+    if orjson is None:
+        return json.dumps(data)
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+# Tipos de valor con los que se puede reutilizar la codificación de event_data
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=4096)
+def _encode_event_items(items: tuple) -> str:
+    """Codifica un event_data a partir de sus (clave, etiqueta, valor); cachea los repetidos"""
+    return _dumps_text({k: v for k, _, v in items})
+
+
+def _cache_tag(value: Any) -> Any:
+    """
+    Discriminador de un escalar para la clave del cache: su tipo, y en los float
+    su representación exacta (0.0 y -0.0 son iguales y tienen el mismo hash)
+    """
+    if type(value) is float:
+        return value.hex()
+    return type(value)
+
+
+def _encode_event_data(event_data: Dict) -> str:
+    """
+    Codifica event_data reutilizando el resultado de eventos idénticos.
+    La etiqueta va en la clave del cache para que 1, 1.0, True, 0.0 y -0.0 no se confundan.
+    Si hay valores anidados (listas, dicts) se codifica sin cache.
+    """
+    items = []
+    for k, v in event_data.items():
+        if not isinstance(v, _SCALAR_TYPES) or not isinstance(k, _SCALAR_TYPES):
+            return _dumps_text(event_data)
+        items.append((k, (_cache_tag(k), _cache_tag(v)), v))
+    return _encode_event_items(tuple(items))
+
 
 class SimulationHistory:
     """
@@ -24,6 +74,31 @@ class SimulationHistory:
     Almacena datos estructurados para análisis posterior.
     """
     
+    # Conexiones de solo lectura que se pueden abrir para las consultas
+    READER_POOL_SIZE = 4
+    
+    # Sentencias de inserción compartidas por los métodos individuales y por lotes
+    INSERT_PLAYER_STATS_SQL = """
+        INSERT INTO player_stats
+        (simulation_id, player_name, final_score, vehicles_destroyed,
+         vehicles_survived, resources_collected, total_distance_traveled,
+         collisions, mine_hits)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    INSERT_EVENT_SQL = """
+        INSERT INTO simulation_events
+        (simulation_id, tick, event_type, event_data, timestamp)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    
+    INSERT_VEHICLE_STATS_SQL = """
+        INSERT INTO vehicle_stats
+        (simulation_id, player_name, vehicle_id, vehicle_type, status,
+         distance_traveled, resources_collected, collision_count, final_position)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
     def __init__(self, db_path: Optional[Path] = None):
         """
         Inicializa el gestor de historial.
@@ -39,14 +114,109 @@ class SimulationHistory:
             db_path = data_dir / "simulation_history.db"
         
         self.db_path = Path(db_path)
+        
+        # Conexión única que se reutiliza en todas las operaciones (se abre al primer uso)
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        # Conexiones de solo lectura para las consultas (se abren a demanda).
+        # Con WAL pueden leer mientras la conexión principal escribe.
+        self._readers: queue.Queue = queue.Queue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
         self._init_database()
     
+    def open_connection(self) -> sqlite3.Connection:
+        """
+        Abre una conexión de escritura nueva con los ajustes de rendimiento.
+        synchronous=NORMAL es seguro con WAL: solo sincroniza al disco en los checkpoints,
+        no en cada commit. Las escrituras concurrentes siguen serializadas por SQLite.
+        La conexión pertenece al hilo que la abre; quien la pide debe cerrarla.
+        """
+        conn = sqlite3.connect(str(self.db_path), cached_statements=256)
+        conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA busy_timeout=5000;
+        """)
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Devuelve la conexión compartida, abriéndola la primera vez. Mantenerla abierta
+        evita reabrir el archivo en cada llamada y permite que SQLite reutilice las
+        sentencias ya preparadas. Solo se usa desde el hilo que creó este objeto.
+        """
+        if self._conn is None:
+            self._conn = self.open_connection()
+        return self._conn
+    
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Toma una conexión de solo lectura libre (o abre una nueva si quedan cupos)"""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        
+        # Reservar el cupo bajo el lock: sin él, llamadas concurrentes podrían
+        # abrir más de READER_POOL_SIZE conexiones
+        with self._reader_lock:
+            full = self._reader_count >= self.READER_POOL_SIZE
+            if not full:
+                self._reader_count += 1
+        if full:
+            return self._readers.get()
+        
+        try:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                   check_same_thread=False, cached_statements=256)
+            conn.executescript("""
+                PRAGMA query_only=1;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+                PRAGMA cache_size=-16384;
+                PRAGMA busy_timeout=5000;
+            """)
+        except Exception:
+            with self._reader_lock:
+                self._reader_count -= 1
+            raise
+        return conn
+    
+    def _release_reader(self, conn: sqlite3.Connection):
+        """Devuelve una conexión de solo lectura al pool"""
+        self._readers.put(conn)
+    
+    def _rollback(self):
+        """Descarta la transacción en curso tras un error, para no arrastrarla a la siguiente operación"""
+        if self._conn is not None:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+    
+    def close(self):
+        """Cierra las conexiones abiertas (se vuelven a abrir si se usan de nuevo)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._reader_lock:
+                self._reader_count -= 1
+    
     def _init_database(self):
         """
         Inicializa la estructura de la base de datos.
         Crea las tablas necesarias si no existen.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._connect()
+        # WAL queda guardado en el archivo, basta con activarlo una vez
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
         
         # Tabla principal de simulaciones
@@ -138,8 +308,18 @@ class SimulationHistory:
             ON vehicle_stats(simulation_id)
         """)
         
+        # Índices compuestos para el JOIN por (simulación, jugador) de la exportación
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_stats_sim_player 
+            ON player_stats(simulation_id, player_name)
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vehicle_stats_sim_player 
+            ON vehicle_stats(simulation_id, player_name, vehicle_id)
+        """)
+        
         conn.commit()
-        conn.close()
     
     def start_simulation(self, simulation_id: str,
                         map_rows: int, map_cols: int,
@@ -157,7 +337,7 @@ class SimulationHistory:
             True si se registró correctamente
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -170,14 +350,14 @@ class SimulationHistory:
                 "running",
                 map_rows,
                 map_cols,
-                json.dumps(config_data) if config_data else None
+                _dumps_text(config_data) if config_data else None
             ))
             
             conn.commit()
-            conn.close()
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     def finish_simulation(self, simulation_id: str,
@@ -185,9 +365,13 @@ class SimulationHistory:
                          winner: str,
                          final_score_p1: int,
                          final_score_p2: int,
-                         end_reason: Optional[str] = None) -> bool:
+                         end_reason: Optional[str] = None,
+                         player_rows: List[tuple] = (),
+                         event_rows: List[tuple] = (),
+                         vehicle_rows: List[tuple] = ()) -> bool:
         """
         Registra la finalización de una simulación.
+        Las filas de estadísticas/eventos recibidas se insertan en la misma transacción.
         
         Args:
             simulation_id: ID de la simulación
@@ -196,14 +380,24 @@ class SimulationHistory:
             final_score_p1: Puntaje final del jugador 1
             final_score_p2: Puntaje final del jugador 2
             end_reason: Razón de finalización (opcional)
+            player_rows: Filas armadas con player_stats_row (opcional)
+            event_rows: Filas armadas con event_row (opcional)
+            vehicle_rows: Filas armadas con vehicle_stats_row (opcional)
             
         Returns:
             True si se actualizó correctamente
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
+            if player_rows:
+                cursor.executemany(self.INSERT_PLAYER_STATS_SQL, player_rows)
+            if event_rows:
+                cursor.executemany(self.INSERT_EVENT_SQL, event_rows)
+            if vehicle_rows:
+                cursor.executemany(self.INSERT_VEHICLE_STATS_SQL, vehicle_rows)
+            
             # Obtener tiempo de inicio para calcular duración
             cursor.execute("""
                 SELECT started_at FROM simulations WHERE simulation_id = ?
@@ -211,7 +405,8 @@ class SimulationHistory:
             
             result = cursor.fetchone()
             if not result:
-                conn.close()
+                # Las filas recibidas se guardan igual, como si se hubieran escrito antes
+                conn.commit()
                 return False
             
             started_at = datetime.fromisoformat(result[0])
@@ -242,10 +437,10 @@ class SimulationHistory:
             ))
             
             conn.commit()
-            conn.close()
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     def add_player_stats(self, simulation_id: str,
@@ -263,32 +458,17 @@ class SimulationHistory:
             True si se registró correctamente
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO player_stats
-                (simulation_id, player_name, final_score, vehicles_destroyed,
-                 vehicles_survived, resources_collected, total_distance_traveled,
-                 collisions, mine_hits)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                simulation_id,
-                player_name,
-                stats.get("final_score", 0),
-                stats.get("vehicles_destroyed", 0),
-                stats.get("vehicles_survived", 0),
-                stats.get("resources_collected", 0),
-                stats.get("total_distance_traveled", 0.0),
-                stats.get("collisions", 0),
-                stats.get("mine_hits", 0)
-            ))
+            cursor.execute(self.INSERT_PLAYER_STATS_SQL,
+                           self.player_stats_row(simulation_id, player_name, stats))
             
             conn.commit()
-            conn.close()
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     def add_event(self, simulation_id: str,
@@ -308,26 +488,17 @@ class SimulationHistory:
             True si se registró correctamente
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO simulation_events
-                (simulation_id, tick, event_type, event_data, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                simulation_id,
-                tick,
-                event_type,
-                json.dumps(event_data) if event_data else None,
-                datetime.now().isoformat()
-            ))
+            cursor.execute(self.INSERT_EVENT_SQL,
+                           self.event_row(simulation_id, tick, event_type, event_data))
             
             conn.commit()
-            conn.close()
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     def add_vehicle_stats(self, simulation_id: str,
@@ -349,31 +520,105 @@ class SimulationHistory:
             True si se registró correctamente
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO vehicle_stats
-                (simulation_id, player_name, vehicle_id, vehicle_type, status,
-                 distance_traveled, resources_collected, collision_count, final_position)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                simulation_id,
-                player_name,
-                vehicle_id,
-                vehicle_type,
-                stats.get("status", "unknown"),
-                stats.get("distance_traveled", 0.0),
-                stats.get("resources_collected", 0),
-                stats.get("collision_count", 0),
-                json.dumps(stats.get("final_position")) if stats.get("final_position") else None
-            ))
+            cursor.execute(self.INSERT_VEHICLE_STATS_SQL,
+                           self.vehicle_stats_row(simulation_id, player_name,
+                                                  vehicle_id, vehicle_type, stats))
             
             conn.commit()
-            conn.close()
             return True
             
         except Exception:
+            self._rollback()
+            return False
+    
+    @staticmethod
+    def player_stats_row(simulation_id: str, player_name: str,
+                         stats: Dict[str, Any]) -> tuple:
+        """Arma la fila de parámetros para INSERT_PLAYER_STATS_SQL"""
+        return (
+            simulation_id,
+            player_name,
+            stats.get("final_score", 0),
+            stats.get("vehicles_destroyed", 0),
+            stats.get("vehicles_survived", 0),
+            stats.get("resources_collected", 0),
+            stats.get("total_distance_traveled", 0.0),
+            stats.get("collisions", 0),
+            stats.get("mine_hits", 0)
+        )
+    
+    @staticmethod
+    def event_row(simulation_id: str, tick: int, event_type: str,
+                  event_data: Optional[Dict] = None) -> tuple:
+        """Arma la fila de parámetros para INSERT_EVENT_SQL (con la hora actual)"""
+        return (
+            simulation_id,
+            tick,
+            event_type,
+            _encode_event_data(event_data) if event_data else None,
+            datetime.now().isoformat()
+        )
+    
+    @staticmethod
+    def vehicle_stats_row(simulation_id: str, player_name: str, vehicle_id: str,
+                          vehicle_type: str, stats: Dict[str, Any]) -> tuple:
+        """Arma la fila de parámetros para INSERT_VEHICLE_STATS_SQL"""
+        return (
+            simulation_id,
+            player_name,
+            vehicle_id,
+            vehicle_type,
+            stats.get("status", "unknown"),
+            stats.get("distance_traveled", 0.0),
+            stats.get("resources_collected", 0),
+            stats.get("collision_count", 0),
+            _dumps_text(stats.get("final_position")) if stats.get("final_position") else None
+        )
+    
+    def add_rows_batch(self, player_rows: List[tuple] = (),
+                       event_rows: List[tuple] = (),
+                       vehicle_rows: List[tuple] = (),
+                       conn: Optional[sqlite3.Connection] = None) -> bool:
+        """
+        Inserta varias filas de estadísticas y eventos en una sola transacción.
+        
+        Args:
+            player_rows: Filas armadas con player_stats_row
+            event_rows: Filas armadas con event_row
+            vehicle_rows: Filas armadas con vehicle_stats_row
+            conn: Conexión a usar (la de open_connection de otro hilo);
+                  por defecto la conexión compartida
+            
+        Returns:
+            True si se registraron correctamente
+        """
+        own_conn = conn is None
+        try:
+            if own_conn:
+                conn = self._connect()
+            cursor = conn.cursor()
+            
+            if player_rows:
+                cursor.executemany(self.INSERT_PLAYER_STATS_SQL, player_rows)
+            if event_rows:
+                cursor.executemany(self.INSERT_EVENT_SQL, event_rows)
+            if vehicle_rows:
+                cursor.executemany(self.INSERT_VEHICLE_STATS_SQL, vehicle_rows)
+            
+            conn.commit()
+            return True
+            
+        except Exception:
+            if own_conn:
+                self._rollback()
+            elif conn is not None:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
             return False
     
     def get_simulation(self, simulation_id: str) -> Optional[Dict[str, Any]]:
@@ -386,10 +631,11 @@ class SimulationHistory:
         Returns:
             Diccionario con datos de la simulación o None
         """
+        conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._acquire_reader()
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute("""
                 SELECT * FROM simulations WHERE simulation_id = ?
@@ -397,7 +643,6 @@ class SimulationHistory:
             
             row = cursor.fetchone()
             if not row:
-                conn.close()
                 return None
             
             simulation = dict(row)
@@ -416,11 +661,13 @@ class SimulationHistory:
             
             simulation["vehicle_stats"] = [dict(r) for r in cursor.fetchall()]
             
-            conn.close()
             return simulation
             
         except Exception:
             return None
+        finally:
+            if conn is not None:
+                self._release_reader(conn)
     
     def list_simulations(self, limit: int = 50,
                         status: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -434,10 +681,11 @@ class SimulationHistory:
         Returns:
             Lista de simulaciones
         """
+        conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._acquire_reader()
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             if status:
                 cursor.execute("""
@@ -455,11 +703,13 @@ class SimulationHistory:
             
             simulations = [dict(row) for row in cursor.fetchall()]
             
-            conn.close()
             return simulations
             
         except Exception:
             return []
+        finally:
+            if conn is not None:
+                self._release_reader(conn)
     
     def get_statistics_summary(self) -> Dict[str, Any]:
         """
@@ -468,19 +718,26 @@ class SimulationHistory:
         Returns:
             Diccionario con estadísticas agregadas
         """
+        conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._acquire_reader()
             cursor = conn.cursor()
             
-            # Total de simulaciones
-            cursor.execute("SELECT COUNT(*) FROM simulations")
-            total_simulations = cursor.fetchone()[0]
-            
-            # Simulaciones completadas
+            # Totales y promedios en una sola pasada sobre la tabla
             cursor.execute("""
-                SELECT COUNT(*) FROM simulations WHERE status = 'completed'
+                SELECT COUNT(*),
+                       COUNT(CASE WHEN status = 'completed' THEN 1 END),
+                       AVG(CASE WHEN status = 'completed' THEN duration_seconds END),
+                       AVG(CASE WHEN status = 'completed' THEN total_ticks END),
+                       AVG(CASE WHEN status = 'completed' THEN final_score_p1 END),
+                       AVG(CASE WHEN status = 'completed' THEN final_score_p2 END)
+                FROM simulations
             """)
-            completed_simulations = cursor.fetchone()[0]
+            (total_simulations, completed_simulations,
+             avg_duration, avg_ticks, avg_p1, avg_p2) = cursor.fetchone()
+            avg_duration = avg_duration or 0
+            avg_ticks = avg_ticks or 0
+            scores = (avg_p1, avg_p2)
             
             # Victorias por jugador
             cursor.execute("""
@@ -491,31 +748,6 @@ class SimulationHistory:
             """)
             wins_by_player = {row[0]: row[1] for row in cursor.fetchall()}
             
-            # Duración promedio
-            cursor.execute("""
-                SELECT AVG(duration_seconds) 
-                FROM simulations 
-                WHERE status = 'completed'
-            """)
-            avg_duration = cursor.fetchone()[0] or 0
-            
-            # Ticks promedio
-            cursor.execute("""
-                SELECT AVG(total_ticks) 
-                FROM simulations 
-                WHERE status = 'completed'
-            """)
-            avg_ticks = cursor.fetchone()[0] or 0
-            
-            # Puntaje promedio
-            cursor.execute("""
-                SELECT AVG(final_score_p1) as avg_p1, AVG(final_score_p2) as avg_p2
-                FROM simulations 
-                WHERE status = 'completed'
-            """)
-            scores = cursor.fetchone()
-            
-            conn.close()
             
             return {
                 "total_simulations": total_simulations,
@@ -529,6 +761,9 @@ class SimulationHistory:
             
         except Exception:
             return {}
+        finally:
+            if conn is not None:
+                self._release_reader(conn)
     
     def delete_simulation(self, simulation_id: str) -> bool:
         """
@@ -541,7 +776,7 @@ class SimulationHistory:
             True si se eliminó correctamente
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Eliminar en orden por integridad referencial
@@ -555,10 +790,10 @@ class SimulationHistory:
                          (simulation_id,))
             
             conn.commit()
-            conn.close()
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     def cleanup_old_simulations(self, days_to_keep: int = 30) -> int:
@@ -572,38 +807,31 @@ class SimulationHistory:
             Número de simulaciones eliminadas
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Calcular fecha límite
             from datetime import timedelta
             cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
             
-            # Obtener IDs a eliminar
-            cursor.execute("""
-                SELECT simulation_id FROM simulations 
-                WHERE started_at < ?
-            """, (cutoff_date,))
-            
-            sim_ids = [row[0] for row in cursor.fetchall()]
-            count = len(sim_ids)
-            
-            # Eliminar cada simulación
-            for sim_id in sim_ids:
-                cursor.execute("DELETE FROM vehicle_stats WHERE simulation_id = ?", 
-                             (sim_id,))
-                cursor.execute("DELETE FROM simulation_events WHERE simulation_id = ?", 
-                             (sim_id,))
-                cursor.execute("DELETE FROM player_stats WHERE simulation_id = ?", 
-                             (sim_id,))
-                cursor.execute("DELETE FROM simulations WHERE simulation_id = ?", 
-                             (sim_id,))
+            # Borrado por conjuntos: una sentencia por tabla en vez de
+            # cuatro DELETE por simulación
+            old_ids = ("SELECT simulation_id FROM simulations "
+                       "WHERE started_at < ?")
+            for table in ("vehicle_stats", "simulation_events", "player_stats"):
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE simulation_id IN ({old_ids})",
+                    (cutoff_date,))
+            
+            cursor.execute("DELETE FROM simulations WHERE started_at < ?",
+                           (cutoff_date,))
+            count = cursor.rowcount
             
             conn.commit()
-            conn.close()
             return count
             
         except Exception:
+            self._rollback()
             return 0
     
     def export_to_dict(self, simulation_id: str) -> Optional[Dict[str, Any]]:
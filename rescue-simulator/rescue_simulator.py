@@ -8,17 +8,23 @@ Desde aquí se inicializa el motor del juego (`GameEngine`)
 y el módulo de visualización (`Visualization`).
 
 Responsabilidades:
-- Crear y mantener el ciclo principal del juego.
+- Crear y mantener el ciclo principal del juego: la simulación avanza a ritmo
+  fijo (UPS) y el dibujado va aparte, limitado a FPS.
+  Con `--bench` no se limita nada: un tick por cuadro, sin esperas, para medir
+  el rendimiento máximo.
 - Delegar la lógica al motor (`GameEngine`).
 - Delegar la representación gráfica a (`Visualization`).
 """
 
+import sys
 import pygame
-from src import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, UPS, MAX_UPDATES_PER_FRAME
 from src.visualization import Visualization
 from src.game_engine import GameEngine
 
 def main():
+    bench_mode = "--bench" in sys.argv
+
     pygame.init()
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -27,12 +33,31 @@ def main():
     engine = GameEngine()
     view = Visualization(screen, engine)
 
+    # Un único reloj: tick() descuenta el tiempo ya usado en el frame
+    clock = pygame.time.Clock()
+    update_step = 1.0 / UPS
+    accumulator = 0.0
+
     running = True
     while running:
+        dt = clock.tick(0 if bench_mode else FPS) / 1000.0
         view.handle_events()
-        engine.update()
+
+        if bench_mode:
+            engine.update()
+        else:
+            # Paso fijo: se ejecutan los ticks que correspondan al tiempo transcurrido
+            accumulator += dt
+            updates = 0
+            while accumulator >= update_step and updates < MAX_UPDATES_PER_FRAME:
+                engine.update()
+                accumulator -= update_step
+                updates += 1
+            # Si la simulación no da abasto, se descarta el atraso en vez de acumularlo
+            if updates == MAX_UPDATES_PER_FRAME:
+                accumulator = 0.0
+
         view.render()
-        pygame.time.Clock().tick(FPS)
     
 
 if __name__ == "__main__":
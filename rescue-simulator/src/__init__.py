@@ -32,4 +32,6 @@ CELL_SIZE = 17          # tamaño de celda del mapa
 SCREEN_WIDTH = 1600     # ancho de ventana
 SCREEN_HEIGHT = 960     # alto de ventana
 FPS = 40                # cuadros por segundo
+UPS = 40                # ticks de simulación por segundo (independiente de los cuadros)
+MAX_UPDATES_PER_FRAME = 5  # tope de ticks atrasados que se recuperan en un solo cuadro
 
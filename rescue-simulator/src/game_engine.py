@@ -17,12 +17,23 @@ import sys
 import importlib.util
 import os
 import time
+import pickle
 from pathlib import Path
 
+# zstandard es opcional: si está instalado los estados guardados se comprimen
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Bytes iniciales de un frame zstd, para distinguir estados comprimidos al cargarlos
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 # Importar sistema de persistencia
 try:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
     from persistence.persistence_manager import PersistenceManager
+    from persistence.config_manager import SimulationConfig
 except ImportError:
     PersistenceManager = None
 
@@ -174,12 +185,7 @@ class GameEngine:
         
         if self.persistence is not None:
             try:
-                config = {
-                    "map": {
-                        "rows": self.map.rows,
-                        "cols": self.map.cols
-                    }
-                }
+                config = SimulationConfig(self.map.rows, self.map.cols)
                 self.persistence.start_new_simulation(config)
             except Exception:
                 pass
@@ -272,9 +278,14 @@ class GameEngine:
             final_path = self._saved_states_dir / f'state_{self.tick}.pickle'
             temp_path = self._saved_states_dir / f'state_{self.tick}.pickle.tmp'
             
+            # Serializar antes de abrir el archivo: si falla no queda un temporal a medias
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+            if zstandard is not None:
+                data = zstandard.ZstdCompressor(level=3).compress(data)
+            
             # Escribir en archivo temporal y mover de forma atómica
             with open(temp_path, 'wb') as f:
-                pickle.dump(state, f)
+                f.write(data)
                 f.flush()
                 try:
                     os.fsync(f.fileno())
@@ -307,7 +318,12 @@ class GameEngine:
         """Carga un estado previo de la simulación"""
         try:
             with open(filename, 'rb') as f:
-                state = pickle.load(f)
+                data = f.read()
+            if data[:4] == ZSTD_MAGIC:
+                if zstandard is None:
+                    return False
+                data = zstandard.ZstdDecompressor().decompress(data)
+            state = pickle.loads(data)
             self.state = state['state']
             self.tick = state['tick']
             self.start_time = time.time() - state['elapsed_time']
@@ -891,19 +907,16 @@ class GameEngine:
             p1_stats = self._calculate_player_stats(self.player1)
             p2_stats = self._calculate_player_stats(self.player2)
             
-            # Finalizar simulación
-            self.persistence.finish_simulation(
+            # Finalizar simulación y registrar estadísticas de jugadores en una sola transacción
+            self.persistence.finalize(
                 total_ticks=self.tick,
                 winner=winner_name,
                 final_score_p1=self.player1.score,
                 final_score_p2=self.player2.score,
-                end_reason=reason
+                end_reason=reason,
+                player_stats={"Jugador_1": p1_stats, "Jugador_2": p2_stats}
             )
             
-            # Registrar estadísticas de jugadores
-            self.persistence.record_player_stats("Jugador_1", p1_stats)
-            self.persistence.record_player_stats("Jugador_2", p2_stats)
-            
         except Exception as e:
             pass
     
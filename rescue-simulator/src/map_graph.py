@@ -30,6 +30,7 @@ class MapGraph:
         self.nodes_by_position: Dict[Tuple[int, int], Node] = {}  # (row, col) -> Node
         self.resources_by_position: Dict[Tuple[int, int], dict] = {}  # (row, col) -> resource_data
         self.vehicles_by_position: Dict[Tuple[int, int], list] = {}  # (row, col) -> [vehicle_data]
+        self.active_nodes: Dict[Tuple[int, int], Node] = {}  # (row, col) -> Node con estado distinto de "empty"
         
         # Inicializar la cuadrícula y conexiones
         self.__post_init_setup__()
@@ -44,9 +45,17 @@ class MapGraph:
         self.__dict__.update(state)
         # Asegurar que la cuadrícula y vecinos estén consistentes si faltan
         if not getattr(self, 'grid', None):
+            self.active_nodes = {}
             self.grid = []
             self.generate_nodes()
             self.connect_neighbors()
+        elif 'active_nodes' not in state:
+            # Estados guardados antes del índice de nodos activos: reconstruirlo
+            self.active_nodes = {}
+            for row_nodes in self.grid:
+                for node in row_nodes:
+                    node._active_nodes = self.active_nodes
+                    node.state = node.state
 
     def __post_init_setup__(self):
         """Helper para inicializar la cuadrícula (usado en el constructor)."""
@@ -59,7 +68,7 @@ class MapGraph:
         for row in range(self.rows):
             row_nodes = []
             for col in range(self.cols):
-                node = Node(row,col)
+                node = Node(row, col, active_nodes=self.active_nodes)
                 row_nodes.append(node)
                 # Agregar a hash table para acceso O(1)
                 self.nodes_by_position[(row, col)] = node
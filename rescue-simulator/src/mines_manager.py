@@ -357,8 +357,8 @@ class MineManager:
                 self.addRandomMine(type_, rows, cols, margin=margin, map_graph=map_graph)
 
 
-# Cache global para rectángulos pre-calculados
-_rect_cache = {}
+# Cache global de celdas de mina pre-renderizadas (relleno + borde negro): (color, tamaño) -> Surface
+_tile_cache = {}
 
 def drawMines(surface, mines: MineManager, rows: int, cols: int, cell_size: int, offset_x: int = 0, offset_y: int = 0) -> None:
     try:
@@ -374,12 +374,15 @@ def drawMines(surface, mines: MineManager, rows: int, cols: int, cell_size: int,
     def cellToPx(row: int, col: int) -> tuple[int, int]:
         return offset_x + col * cell_size, offset_y + row * cell_size
     
-    # Obtiene un rectángulo del caché o lo crea
-    def get_cached_rect(x: int, y: int) -> pygame.Rect:
-        cache_key = (x, y, cell_size)
-        if cache_key not in _rect_cache:
-            _rect_cache[cache_key] = pygame.Rect(x, y, cell_size, cell_size)
-        return _rect_cache[cache_key]
+    # Obtiene la celda ya pintada (relleno del color + borde para mantener la cuadrícula visible)
+    def get_cached_tile(color: tuple) -> "pygame.Surface":
+        cache_key = (color, cell_size)
+        if cache_key not in _tile_cache:
+            tile = pygame.Surface((cell_size, cell_size))
+            tile.fill(color)
+            pygame.draw.rect(tile, (0, 0, 0), tile.get_rect(), 1)
+            _tile_cache[cache_key] = tile
+        return _tile_cache[cache_key]
 
     # Dibuja cada mina según su tipo
     for mine in mines.all():
@@ -403,17 +406,11 @@ def drawMines(surface, mines: MineManager, rows: int, cols: int, cell_size: int,
                     current_col = mine_col + delta_col
                     if 0 <= current_row < rows and 0 <= current_col < cols:
                         if (delta_row * delta_row + delta_col * delta_col) <= radius * radius:
-                            x, y = cellToPx(current_row, current_col)
-                            rect = get_cached_rect(x, y)
-                            
-                            # Centro en rojo, radio en amarillo
+                            # Centro en rojo, radio en amarillo (cada uno con su borde)
                             if delta_row == 0 and delta_col == 0:
-                                pygame.draw.rect(surface, (140, 0, 0), rect, 0) 
+                                surface.blit(get_cached_tile((140, 0, 0)), cellToPx(current_row, current_col))
                             else:
-                                pygame.draw.rect(surface, PALETTE_4, rect, 0) 
-                            
-                            # Dibuja un borde para mantener la cuadrícula visible
-                            pygame.draw.rect(surface, (0, 0, 0), rect, 1)
+                                surface.blit(get_cached_tile(PALETTE_4), cellToPx(current_row, current_col))
 
         elif mine.type is MineType.T1:
             # Extensión horizontal: ±7 celdas desde el centro
@@ -423,16 +420,11 @@ def drawMines(surface, mines: MineManager, rows: int, cols: int, cell_size: int,
             
             # Solo dibuja la línea horizontal (1 fila)
             for current_col in range(start_col, end_col + 1):
-                x, y = cellToPx(mine_row, current_col)
-                rect = get_cached_rect(x, y)
-                
                 # Centro en rojo, resto en amarillo
                 if current_col == mine_col:
-                    pygame.draw.rect(surface, (140, 0, 0), rect, 0)
+                    surface.blit(get_cached_tile((140, 0, 0)), cellToPx(mine_row, current_col))
                 else:
-                    pygame.draw.rect(surface, PALETTE_4, rect, 0)
-                
-                pygame.draw.rect(surface, (0, 0, 0), rect, 1)
+                    surface.blit(get_cached_tile(PALETTE_4), cellToPx(mine_row, current_col))
 
         # Dibujo para banda vertical (T2) - Línea vertical de 1 columna
         elif mine.type is MineType.T2:
@@ -443,15 +435,10 @@ def drawMines(surface, mines: MineManager, rows: int, cols: int, cell_size: int,
             
             # Solo dibuja la línea vertical (1 columna)
             for current_row in range(start_row, end_row + 1):
-                x, y = cellToPx(current_row, mine_col)
-                rect = get_cached_rect(x, y)
-                
                 if current_row == mine_row:
-                    pygame.draw.rect(surface, (140, 0, 0), rect, 0)
+                    surface.blit(get_cached_tile((140, 0, 0)), cellToPx(current_row, mine_col))
                 else:
-                    pygame.draw.rect(surface, PALETTE_4, rect, 0) 
-                
-                pygame.draw.rect(surface, (0, 0, 0), rect, 1)
+                    surface.blit(get_cached_tile(PALETTE_4), cellToPx(current_row, mine_col))
 
     def _overlap(self, a: Mine, b: Mine) -> bool:
         """Verifica si dos minas se superponen"""
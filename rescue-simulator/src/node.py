@@ -10,12 +10,46 @@ y contenido (recurso, mina, base, etc).
 
 """
 class Node:
-    def __init__(self, row, col, state="empty", content=None):
+    def __init__(self, row, col, state="empty", content=None, active_nodes=None):
+        """
+        active_nodes: dict (row, col) -> Node compartido con el grafo; el nodo se registra
+        ahí mientras su estado no sea "empty" (permite recorrer solo las celdas ocupadas).
+        """
+        self._active_nodes = active_nodes
         self.row = row
         self.col = col
         self.state = state
         self.content = content if content else {}
         self.neighbors = []
+    
+    @property
+    def state(self):
+        return self._state
+    
+    @state.setter
+    def state(self, value):
+        """
+        Mantiene actualizado el índice de nodos no vacíos del grafo en cada cambio de estado.
+        El resto de atributos se escriben directamente, sin pasar por este hook.
+        """
+        self._state = value
+        active_nodes = self._active_nodes
+        if active_nodes is not None:
+            if value == "empty":
+                active_nodes.pop((self.row, self.col), None)
+            else:
+                active_nodes[(self.row, self.col)] = self
+    
+    def __setstate__(self, state):
+        """
+        Método especial para pickle: los estados guardados antes de la propiedad
+        traen "state" en el __dict__, que se pasa a _state.
+        """
+        if "state" in state:
+            state = dict(state)
+            state["_state"] = state.pop("state")
+        state.setdefault("_active_nodes", None)
+        self.__dict__.update(state)
     def add_neighbor(self, neighbor_node):
         """
         Añade un nodo vecino a la lista de vecinos.
@@ -15,6 +15,19 @@ from pathlib import Path
 import pickle
 from src.vehicle import VehicleManager
 
+# Imágenes de vehículos del panel lateral ya escaladas: path -> Surface (None si no se pudo cargar)
+_VEHICLE_IMG_CACHE = {}
+
+def _get_vehicle_image(img_path):
+    """Carga y escala la imagen de un vehículo una sola vez; las siguientes llamadas usan el caché."""
+    if img_path not in _VEHICLE_IMG_CACHE:
+        try:
+            img = pygame.image.load(img_path).convert_alpha()
+            _VEHICLE_IMG_CACHE[img_path] = pygame.transform.scale(img, (64, 64))
+        except Exception:
+            _VEHICLE_IMG_CACHE[img_path] = None
+    return _VEHICLE_IMG_CACHE[img_path]
+
 class Player:
     def __init__(self, name: str, base_position: tuple, strategy=None):
         """
@@ -119,14 +132,9 @@ class Player:
 
         for key, vehicle in self.vehicles.items():
             img_path = getattr(vehicle, "img_path", None)
-            if img_path:
-                try:
-                    img = pygame.image.load(img_path).convert_alpha()
-                    img = pygame.transform.scale(img, (64, 64))
-                    surface.blit(img, (x+20, margin-16))
-                except:
-                    rect = pygame.Rect(x+20, margin, 64, 64)
-                    pygame.draw.rect(surface, vehicle.color, rect)
+            img = _get_vehicle_image(img_path) if img_path else None
+            if img:
+                surface.blit(img, (x+20, margin-16))
             else:
                 rect = pygame.Rect(x+20, margin, 64, 64)
                 pygame.draw.rect(surface, vehicle.color, rect)
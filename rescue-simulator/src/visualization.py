@@ -20,6 +20,8 @@ from src import PALETTE_6, PALETTE_1, PALETTE_2, PALETTE_3, PALETTE_4, PALETTE_5
 BLACK = (22, 33, 60)
 PALETTE = (46, 68, 96)
 CELL_SIZE = 17
+# Estados de nodo que se dibujan sobre la grilla (el resto solo muestra el borde de la celda)
+DRAWN_STATES = frozenset(("base_p1", "base_p2", "resource", "vehicle"))
 
 class Visualization:
     def __init__(self, screen, engine):
@@ -27,6 +29,12 @@ class Visualization:
         self.engine = engine
         self.buttons = []
         self.image_cache = {}
+        self.font_cache = {}
+        self.overlay_cache = {}
+        self.text_cache = {}
+        self.grid_overlay = None
+        self.resource_atlas = None
+        self.resource_atlas_rects = {}
         self.create_buttons()
 
     def get_cached_image(self, img_path, size):
@@ -52,6 +60,64 @@ class Visualization:
         
         return self.image_cache[cache_key]
 
+    def get_resource_sprite(self, img_path):
+        """
+        Obtiene el ícono de un recurso dentro del atlas de recursos: (atlas, rect de origen).
+        Todos los íconos (uno por tipo) viven en una sola superficie, que crece la primera
+        vez que aparece una imagen nueva. Retorna (None, None) si la imagen no se puede cargar.
+        """
+        if img_path not in self.resource_atlas_rects:
+            img = self.get_cached_image(img_path, (CELL_SIZE, CELL_SIZE))
+            if img is None:
+                self.resource_atlas_rects[img_path] = None
+            else:
+                index = sum(1 for rect in self.resource_atlas_rects.values() if rect is not None)
+                atlas = pygame.Surface(((index + 1) * CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+                if self.resource_atlas is not None:
+                    atlas.blit(self.resource_atlas, (0, 0))
+                atlas.blit(img, (index * CELL_SIZE, 0))
+                self.resource_atlas = atlas
+                self.resource_atlas_rects[img_path] = pygame.Rect(index * CELL_SIZE, 0, CELL_SIZE, CELL_SIZE)
+        
+        src_rect = self.resource_atlas_rects[img_path]
+        if src_rect is None:
+            return None, None
+        return self.resource_atlas, src_rect
+
+    def get_cached_font(self, size):
+        """
+        Obtiene la fuente Press Start 2P del tamaño pedido desde el caché.
+        Si no se puede cargar, usa la fuente por defecto de pygame.
+        """
+        if size not in self.font_cache:
+            try:
+                font_path = Path(__file__).resolve().parents[1] / "assets" / "Press_Start_2P" / "PressStart2P-Regular.ttf"
+                self.font_cache[size] = pygame.font.Font(str(font_path), size)
+            except Exception:
+                self.font_cache[size] = pygame.font.Font(None, size)
+        return self.font_cache[size]
+
+    def get_cached_overlay(self, size, color, alpha):
+        """Obtiene una capa semitransparente del tamaño y color pedidos desde el caché."""
+        cache_key = (size, color, alpha)
+        if cache_key not in self.overlay_cache:
+            overlay = pygame.Surface(size)
+            overlay.set_alpha(alpha)
+            overlay.fill(color)
+            self.overlay_cache[cache_key] = overlay
+        return self.overlay_cache[cache_key]
+
+    def get_cached_text(self, text, size, color):
+        """
+        Obtiene el texto ya renderizado desde el caché.
+        Solo para textos fijos (títulos, etiquetas): el caché no tiene límite, así que
+        los textos que cambian entre partidas deben renderizarse directamente.
+        """
+        cache_key = (text, size, color)
+        if cache_key not in self.text_cache:
+            self.text_cache[cache_key] = self.get_cached_font(size).render(text, True, color)
+        return self.text_cache[cache_key]
+
     def create_buttons(self):
 
         base_path = Path(__file__).resolve().parent
@@ -76,11 +142,23 @@ class Visualization:
         
         self.buttons = []
 
+    def realign_buttons(self):
+        """Recalcula la posición de todos los botones (tras un cambio de tamaño de la ventana)"""
+        refresh_screen_rect()
+        for button in (self.init_button, self.play_button, self.forward_button, self.stop_button,
+                       self.play_button_centered, self.forward_button_centered, self.stop_button_centered,
+                       self.exit_button):
+            button.realign()
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 exit()
             
+            # Los botones guardan su posición: solo se recalcula si cambia la ventana
+            if event.type == pygame.VIDEORESIZE:
+                self.realign_buttons()
+            
             # Determinar qué botones mostrar según el estado
             show_init = self.engine.state in ("stopped", "game_over")
             
@@ -135,6 +213,27 @@ class Visualization:
         
         pygame.display.flip()
 
+    def get_grid_overlay(self, rows, cols):
+        """
+        Obtiene la grilla del mapa (bordes de todas las celdas) pre-renderizada sobre una
+        superficie transparente. Es estática: se dibuja una sola vez por tamaño de mapa.
+        """
+        width, height = cols * CELL_SIZE, rows * CELL_SIZE
+        if self.grid_overlay is None or self.grid_overlay.get_size() != (width, height):
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            # Cada celda tiene su propio borde de 1 px: entre celdas vecinas quedan dos líneas
+            # (última columna/fila de una y primera de la siguiente)
+            for col in range(cols):
+                x = col * CELL_SIZE
+                pygame.draw.line(overlay, PALETTE_6, (x, 0), (x, height - 1))
+                pygame.draw.line(overlay, PALETTE_6, (x + CELL_SIZE - 1, 0), (x + CELL_SIZE - 1, height - 1))
+            for row in range(rows):
+                y = row * CELL_SIZE
+                pygame.draw.line(overlay, PALETTE_6, (0, y), (width - 1, y))
+                pygame.draw.line(overlay, PALETTE_6, (0, y + CELL_SIZE - 1), (width - 1, y + CELL_SIZE - 1))
+            self.grid_overlay = overlay
+        return self.grid_overlay
+
     def drawMap(self):
         graph = self.engine.map.graph
         
@@ -144,71 +243,83 @@ class Visualization:
         self.engine.player1.drawPlayerBase(self.screen, 49,190)
         self.engine.player2.drawPlayerBase(self.screen, 1270,190)
 
-        for row in range(graph.rows):
-            for col in range(graph.cols):
-                node = graph.get_node(row, col)
-                x, y = col * CELL_SIZE + 390, row * CELL_SIZE + 20
-                rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+        # Grilla en un solo blit; luego solo se recorren las celdas con contenido
+        # (las bases se pintan encima con su propio borde)
+        self.screen.blit(self.get_grid_overlay(graph.rows, graph.cols), (390, 20))
+
+        # Solo las celdas no vacías, en orden fila por fila (los vehículos grandes se superponen)
+        active_nodes = getattr(graph, "active_nodes", None)
+        if active_nodes is None:
+            cells = [((row, col), node) for row, row_nodes in enumerate(graph.grid) for col, node in enumerate(row_nodes)]
+        else:
+            cells = sorted(active_nodes.items())
+
+        for (row, col), node in cells:
+            if node.state not in DRAWN_STATES:
+                continue
+            x, y = col * CELL_SIZE + 390, row * CELL_SIZE + 20
+            rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+            
+            if node.state in ("base_p1", "base_p2"):
+                if node.state == "base_p1":
+                    BASE_COLOR = (40, 60, 90) 
+                    BORDER_COLOR = (70, 110, 180)
+                else:
+                    BASE_COLOR = (90, 40, 40) 
+                    BORDER_COLOR = (180, 70, 70)  
                 
-                if node.state in ("base_p1", "base_p2"):
-                    if node.state == "base_p1":
-                        BASE_COLOR = (40, 60, 90) 
-                        BORDER_COLOR = (70, 110, 180)
-                    else:
-                        BASE_COLOR = (90, 40, 40) 
-                        BORDER_COLOR = (180, 70, 70)  
-                    
-                    pygame.draw.rect(self.screen, BASE_COLOR, rect, 0)  
-                    pygame.draw.rect(self.screen, BORDER_COLOR, rect, 1) 
+                pygame.draw.rect(self.screen, BASE_COLOR, rect, 0)  
+                pygame.draw.rect(self.screen, BORDER_COLOR, rect, 1) 
+            
+            if node.state == 'resource' and node.content:
+                atlas, src_rect = self.get_resource_sprite(node.content.img_path)
+                if atlas:
+                    self.screen.blit(atlas, (x, y), src_rect)
+            # Dibujar vehículos (pueden estar en estado "vehicle" o en bases con contenido)
+            if (node.state == "vehicle" or node.state in ("base_p1", "base_p2")) and node.content:
+                v = node.content
                 
-                if node.state == 'resource' and node.content:
-                    img = self.get_cached_image(node.content.img_path, (CELL_SIZE, CELL_SIZE))
-                    if img:
-                        self.screen.blit(img, (x, y))
-                # Dibujar vehículos (pueden estar en estado "vehicle" o en bases con contenido)
-                if (node.state == "vehicle" or node.state in ("base_p1", "base_p2")) and node.content:
-                    v = node.content
-                    
-                    vehicles_to_draw = []
-                    if isinstance(v, list):
-                        vehicles_to_draw = v
+                vehicles_to_draw = []
+                if isinstance(v, list):
+                    vehicles_to_draw = v
+                else:
+                    vehicles_to_draw = [v]
+                
+                for idx, vehicle_data in enumerate(vehicles_to_draw):
+                    vehicle_obj = None
+                    if isinstance(vehicle_data, dict):
+                        vehicle_obj = vehicle_data.get("object")
                     else:
-                        vehicles_to_draw = [v]
+                        vehicle_obj = vehicle_data
                     
-                    for idx, vehicle_data in enumerate(vehicles_to_draw):
-                        vehicle_obj = None
-                        if isinstance(vehicle_data, dict):
-                            vehicle_obj = vehicle_data.get("object")
-                        else:
-                            vehicle_obj = vehicle_data
+                    if vehicle_obj:
+                        status = getattr(vehicle_obj, "status", None)
+                        if status == "destroyed":
+                            continue
                         
-                        if vehicle_obj:
-                            status = getattr(vehicle_obj, "status", None)
-                            if status == "destroyed":
-                                continue
+                        img_path = getattr(vehicle_obj, "img_path", None)
+                        if img_path:
+                            VEHICLE_SCALE = 2.5
+                            vehicle_size = int(CELL_SIZE * VEHICLE_SCALE)
+                            img = self.get_cached_image(img_path, (vehicle_size, vehicle_size))
                             
-                            img_path = getattr(vehicle_obj, "img_path", None)
-                            if img_path:
-                                VEHICLE_SCALE = 2.5
-                                vehicle_size = int(CELL_SIZE * VEHICLE_SCALE)
-                                img = self.get_cached_image(img_path, (vehicle_size, vehicle_size))
+                            if img:
+                                displacement = 0
+                                if len(vehicles_to_draw) > 1:
+                                    displacement = idx * 3 
                                 
-                                if img:
-                                    displacement = 0
-                                    if len(vehicles_to_draw) > 1:
-                                        displacement = idx * 3 
-                                    
-                                    offset_x = x - (vehicle_size - CELL_SIZE) // 2 + displacement
-                                    offset_y = y - (vehicle_size - CELL_SIZE) // 2 + displacement
-                                    self.screen.blit(img, (offset_x, offset_y))
-                            else:
-                                color = getattr(vehicle_obj, "color", (255, 255, 255))
-                                displacement = idx * 3 if len(vehicles_to_draw) > 1 else 0
-                                circle_center = (rect.center[0] + displacement, rect.center[1] + displacement)
-                                pygame.draw.circle(self.screen, color, circle_center, 6)
-
-                if node.state not in ("base_p1", "base_p2"): 
-                    pygame.draw.rect(self.screen, PALETTE_6, rect, 1)
+                                offset_x = x - (vehicle_size - CELL_SIZE) // 2 + displacement
+                                offset_y = y - (vehicle_size - CELL_SIZE) // 2 + displacement
+                                self.screen.blit(img, (offset_x, offset_y))
+                        else:
+                            color = getattr(vehicle_obj, "color", (255, 255, 255))
+                            displacement = idx * 3 if len(vehicles_to_draw) > 1 else 0
+                            circle_center = (rect.center[0] + displacement, rect.center[1] + displacement)
+                            pygame.draw.circle(self.screen, color, circle_center, 6)
+
+            # El borde va encima del contenido, como en el resto de la grilla
+            if node.state not in ("base_p1", "base_p2"): 
+                pygame.draw.rect(self.screen, PALETTE_6, rect, 1)
 
     def drawCollisionAnimations(self):
         """Dibuja las animaciones de colisiones activas"""
@@ -344,23 +455,12 @@ class Visualization:
         info = self.engine.game_over_info
         screen_width, screen_height = self.screen.get_size()
 
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(230)
-        overlay.fill((10, 15, 25)) 
+        # La capa y las fuentes se crean una sola vez: esta pantalla se redibuja cada frame
+        overlay = self.get_cached_overlay((screen_width, screen_height), (10, 15, 25), 230)
         self.screen.blit(overlay, (0, 0))
 
-        try:
-            root_path = Path(__file__).resolve().parents[1]
-            font_path = root_path / "assets" / "Press_Start_2P" / "PressStart2P-Regular.ttf"
-            title_font = pygame.font.Font(str(font_path), 50)
-            header_font = pygame.font.Font(str(font_path), 38)
-            info_font = pygame.font.Font(str(font_path), 24)
-            small_font = pygame.font.Font(str(font_path), 14)
-        except Exception:
-            title_font = pygame.font.Font(None, 50)
-            header_font = pygame.font.Font(None, 38)
-            info_font = pygame.font.Font(None, 24)
-            small_font = pygame.font.Font(None, 14)
+        info_font = self.get_cached_font(24)
+        small_font = self.get_cached_font(14)
 
         y_offset = 50
 
@@ -368,15 +468,17 @@ class Visualization:
         title_color = (255, 255, 120) 
         shadow_color = (80, 80, 0)    
         
-        title_shadow = title_font.render(title_text, True, shadow_color)
+        title_shadow = self.get_cached_text(title_text, 50, shadow_color)
         shadow_rect = title_shadow.get_rect(center=(screen_width // 2 + 3, y_offset + 3))
         self.screen.blit(title_shadow, shadow_rect)
         
-        title = title_font.render(title_text, True, title_color)
+        title = self.get_cached_text(title_text, 50, title_color)
         title_rect = title.get_rect(center=(screen_width // 2, y_offset))
         self.screen.blit(title, title_rect)
         y_offset += 100
 
+        # Los textos propios de cada partida se renderizan directo: cachearlos dejaría
+        # superficies sin liberar por cada partida terminada
         reason_text = small_font.render(info.get("reason", ""), True, PALETTE_3)
         reason_rect = reason_text.get_rect(center=(screen_width // 2, y_offset))
         self.screen.blit(reason_text, reason_rect)
@@ -390,9 +492,9 @@ class Visualization:
         winner_color = winner_colors.get(info.get("winner_color"), (255, 255, 255))
 
         if info.get("winner") == "Empate":
-            winner_text = header_font.render("¡EMPATE!", True, winner_color)
+            winner_text = self.get_cached_text("¡EMPATE!", 38, winner_color)
         else:
-            winner_text = header_font.render(f"¡GANADOR: {str(info.get('winner','')).upper()}!", True, winner_color)
+            winner_text = self.get_cached_font(38).render(f"¡GANADOR: {str(info.get('winner','')).upper()}!", True, winner_color)
 
         winner_rect = winner_text.get_rect(center=(screen_width // 2, y_offset))
         self.screen.blit(winner_text, winner_rect)
@@ -448,7 +550,7 @@ class Visualization:
                 )
 
         y_offset = screen_height - 100
-        restart_text = small_font.render("Presiona el botón INIT para jugar de nuevo", True, PALETTE_3)
+        restart_text = self.get_cached_text("Presiona el botón INIT para jugar de nuevo", 14, PALETTE_3)
         restart_rect = restart_text.get_rect(center=(screen_width // 2, y_offset))
         self.screen.blit(restart_text, restart_rect)
 
@@ -510,8 +612,11 @@ class Button:
         self.rect = align(self.image, position, offset)
         self.action = action
 
-    def draw(self, screen):
+    def realign(self):
+        """Recalcula la posición del botón (solo hace falta si cambia el tamaño de la ventana)"""
         self.rect = align(self.image, self.position, self.offset)
+
+    def draw(self, screen):
         screen.blit(self.image, self.rect)
 
     def handle_event(self, event):
@@ -520,20 +625,42 @@ class Button:
                 if self.action:
                     self.action()
 
+def _align_bottom(rect, screen_rect, margin):
+    rect.midbottom = screen_rect.midbottom
+    rect.y -= margin
+
+def _align_bottom_left(rect, screen_rect, margin):
+    rect.bottomleft = screen_rect.bottomleft
+    rect.x += margin
+    rect.y -= margin
+
+def _align_top_right(rect, screen_rect, margin):
+    rect.topright = screen_rect.topright
+    rect.x -= margin
+    rect.y += margin
+
+# Posición -> función que ubica el rect dentro de la pantalla
+_ALIGNERS = {
+    "bottom": _align_bottom,
+    "bottomLeft": _align_bottom_left,
+    "topRight": _align_top_right,
+}
+
+# Rect de la pantalla: se guarda y solo se vuelve a pedir al cambiar el tamaño de la ventana
+_screen_rect = None
+
+def refresh_screen_rect():
+    """Vuelve a leer el tamaño de la ventana (llamar tras un VIDEORESIZE)"""
+    global _screen_rect
+    _screen_rect = pygame.display.get_surface().get_rect()
+
 def align(surface, position, offset=(0,0), margin=10):
-    screen_rect = pygame.display.get_surface().get_rect()
+    if _screen_rect is None:
+        refresh_screen_rect()
     rect = surface.get_rect()
-    if position == "bottom":
-        rect.midbottom = screen_rect.midbottom
-        rect.y -= margin
-    elif position == "bottomLeft":
-        rect.bottomleft = screen_rect.bottomleft
-        rect.x += margin
-        rect.y -= margin
-    elif position == "topRight":
-        rect.topright = screen_rect.topright
-        rect.x -= margin
-        rect.y += margin
+    aligner = _ALIGNERS.get(position)
+    if aligner:
+        aligner(rect, _screen_rect, margin)
     
     rect.move_ip(offset)
     return rect
@@ -562,6 +689,10 @@ class TextButton:
         self._update_surface()
         self.rect = align(self.surface, position, offset)
     
+    def realign(self):
+        """Recalcula la posición del botón según el texto y el tamaño de la ventana"""
+        self.rect = align(self.surface, self.position, self.offset)
+    
     def _update_surface(self):
         """Actualiza la superficie del texto"""
         color = self.hover_color if self.hovered else self.color
@@ -575,7 +706,7 @@ class TextButton:
         
         if was_hovered != self.hovered:
             self._update_surface()
-            self.rect = align(self.surface, self.position, self.offset)
+            self.realign()
         
         screen.blit(self.surface, self.rect)
     